@@ -261,8 +261,10 @@ class AutopilotScheduler:
     ) -> None:
         if policy_loader is None:
             if policy_manager is None:
+                # Only read from here on: the consent ledger is never opened,
+                # so there is no handle for the scheduler to close.
                 policy_manager = PolicyManager()
-            policy_loader = policy_manager._read_policy
+            policy_loader = policy_manager._current_policy
         self._policy_loader = policy_loader
         self._policy_manager = policy_manager
         if state_path is None:
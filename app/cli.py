@@ -524,30 +524,30 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 0
 
     if args.command == "policy":
-        manager = PolicyManager()
-        try:
-            if args.policy_command == "show":
-                print(manager.show().rstrip())
-                return 0
-            if args.policy_command == "approve":
-                approval = manager.approve(domain=args.domain, scope=args.scope)
-                print(
-                    "Autorisation enregistrée pour "
-                    f"{approval.domain} ({approval.scope})"
-                )
-                return 0
-            if args.policy_command == "revoke":
-                manager.revoke(args.domain, scope=args.scope)
-                if args.scope:
+        with PolicyManager() as manager:
+            try:
+                if args.policy_command == "show":
+                    print(manager.show().rstrip())
+                    return 0
+                if args.policy_command == "approve":
+                    approval = manager.approve(domain=args.domain, scope=args.scope)
                     print(
-                        "Autorisation révoquée pour "
-                        f"{args.domain} ({args.scope.strip().lower()})"
+                        "Autorisation enregistrée pour "
+                        f"{approval.domain} ({approval.scope})"
                     )
-                else:
-                    print(f"Autorisation révoquée pour {args.domain}")
-                return 0
-        except PolicyError as exc:
-            parser.error(str(exc))
+                    return 0
+                if args.policy_command == "revoke":
+                    manager.revoke(args.domain, scope=args.scope)
+                    if args.scope:
+                        print(
+                            "Autorisation révoquée pour "
+                            f"{args.domain} ({args.scope.strip().lower()})"
+                        )
+                    else:
+                        print(f"Autorisation révoquée pour {args.domain}")
+                    return 0
+            except PolicyError as exc:
+                parser.error(str(exc))
 
     if args.command == "run":
         engine = Engine()
@@ -806,7 +806,7 @@ def _build_autopilot_pipeline() -> IngestPipeline:
     store = SimpleVectorStore(namespace="autopilot")
     manager = PolicyManager()
     try:
-        policy = manager._read_policy()
+        policy = manager._current_policy()
         min_sources = max(2, policy.require_corroboration)
     except PolicyError:
         min_sources = 2
@@ -102,6 +102,13 @@ class LLMSettings(SectionSettings):
         default=Path("models/llm/smollm-135m-instruct.Q4_0.gguf"),
         description="Chemin du fichier GGUF pour llama.cpp.",
     )
+    quantization: str | None = Field(
+        default=None,
+        description=(
+            "Variante quantifiée préférée (ex. Q4_K_M) ; un fichier voisin "
+            "<modèle>.<quantization>.gguf est utilisé s'il existe."
+        ),
+    )
     ctx: int | None = Field(
         default=2048,
         description="Taille de fenêtre de contexte à utiliser avec le backend local.",
@@ -110,6 +117,25 @@ class LLMSettings(SectionSettings):
         default=None,
         description="Nombre de threads CPU à réserver pour llama.cpp (auto si None).",
     )
+    threads_batch: int | None = Field(
+        default=None,
+        description=(
+            "Threads utilisés pour l'évaluation du prompt par llama.cpp "
+            "(identique à threads si None)."
+        ),
+    )
+    batch_size: int = Field(
+        default=2048,
+        description="Taille de lot logique (n_batch) pour l'évaluation du prompt.",
+    )
+    ubatch_size: int = Field(
+        default=512,
+        description="Taille de micro-lot physique (n_ubatch) pour llama.cpp.",
+    )
+    mlock: bool = Field(
+        default=False,
+        description="Verrouille les poids du modèle en mémoire (use_mlock).",
+    )
     max_tokens: int = Field(
         default=256,
         description="Nombre maximum de tokens générés par requête.",
@@ -129,6 +155,32 @@ class LLMSettings(SectionSettings):
         default="Echo",
         description="Préfixe utilisé lorsque la génération échoue.",
     )
+    max_prompt_chars: int = Field(
+        default=1_000_000,
+        description="Longueur maximale (en caractères) d'un prompt envoyé au LLM.",
+    )
+    cache_size: int = Field(
+        default=0,
+        description=(
+            "Nombre de réponses conservées en cache LRU par (modèle, contexte, "
+            "prompt système, segment) ; 0 désactive le cache. Seul le décodage "
+            "déterministe (temperature = 0) est mis en cache."
+        ),
+    )
+    prewarm: bool = Field(
+        default=False,
+        description=(
+            "Ouvre en arrière-plan la connexion vers le serveur Ollama dès la "
+            "création du client."
+        ),
+    )
+    cache_ttl: float = Field(
+        default=0.0,
+        description=(
+            "Durée de validité (secondes) d'une réponse en cache ; 0 la conserve "
+            "jusqu'à son éviction."
+        ),
+    )
 
     @field_validator("backend", "model", "fallback_phrase")
     @classmethod
@@ -144,13 +196,41 @@ class LLMSettings(SectionSettings):
             raise ValueError("ctx must be a positive integer")
         return value
 
-    @field_validator("threads")
+    @field_validator("threads", "threads_batch")
     @classmethod
     def _threads_positive(cls, value: int | None) -> int | None:
         if value is not None and value < 1:
             raise ValueError("threads must be a positive integer when provided")
         return value
 
+    @field_validator("max_prompt_chars")
+    @classmethod
+    def _positive_prompt_chars(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("max_prompt_chars must be a positive integer")
+        return value
+
+    @field_validator("batch_size", "ubatch_size")
+    @classmethod
+    def _positive_batch(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("batch sizes must be positive integers")
+        return value
+
+    @field_validator("cache_size")
+    @classmethod
+    def _cache_size_non_negative(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("cache_size must be zero or a positive integer")
+        return value
+
+    @field_validator("cache_ttl")
+    @classmethod
+    def _cache_ttl_non_negative(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("cache_ttl must be zero or a positive number")
+        return value
+
     @field_validator("max_tokens")
     @classmethod
     def _positive_tokens(cls, value: int) -> int:
@@ -203,6 +283,13 @@ class MemorySettings(SectionSettings):
         default=Path("models/embeddings/all-MiniLM-L6-v2"),
         description="Chemin local vers le modèle d'embedding.",
     )
+    prewarm_local_encoder: bool = Field(
+        default=False,
+        description=(
+            "Charge le modèle d'embedding local en arrière-plan afin qu'un repli "
+            "depuis Ollama ne subisse pas le temps de chargement."
+        ),
+    )
     summary_max_tokens: int = Field(
         default=512,
         description="Limite de tokens pour les résumés.",
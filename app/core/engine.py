@@ -218,10 +218,15 @@ class Engine:
             details = [t for _s, _i, k, t in results if k == "detail"]
 
             # Combine the original prompt with retrieved excerpts before sending to
-            # the LLM.
+            # the LLM, truncating the excerpts so the client's size limit holds.
             llm_prompt = user_prompt
             if excerpts:
-                llm_prompt = "\n\n".join([llm_prompt, "\n".join(excerpts)])
+                context = "\n".join(excerpts)
+                limit = getattr(self.client, "max_prompt_chars", None)
+                if limit is not None:
+                    context = context[: max(0, limit - len(user_prompt) - 2)]
+                if context:
+                    llm_prompt = "\n\n".join([llm_prompt, context])
 
             answer, trace = self.client.generate(llm_prompt)
 
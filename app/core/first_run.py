@@ -326,12 +326,13 @@ class FirstRunConfigurator:
         except LedgerError:
             return
 
-        ledger.record(
-            action="init",
-            domain="*",
-            scope="bootstrap",
-            policy_hash=self._hash_path(self.policy_path),
-        )
+        with ledger:
+            ledger.record(
+                action="init",
+                domain="*",
+                scope="bootstrap",
+                policy_hash=self._hash_path(self.policy_path),
+            )
 
     def _hash_path(self, path: Path) -> str:
         digest = hashlib.sha256()
@@ -388,15 +388,15 @@ class Memory:
         """Return embedding for ``text`` using a simple in-memory cache."""
         if self._offline:
             vecs = embed_local([text])
-            return vecs[0] if vecs else self._zero_vector
+            return vecs[0] if len(vecs) else self._zero_vector
         if use_cache and text in self._embed_cache:
             return self._embed_cache[text]
         vecs = embed_ollama([text])
-        if not vecs:
+        if not len(vecs):
             vecs = embed_local([text])
         vec = (
             vecs[0].astype("float32")
-            if vecs
+            if len(vecs)
             else np.zeros(1, dtype=np.float32)
         )
         if use_cache:
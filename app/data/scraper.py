@@ -11,40 +11,90 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import AsyncIterator, Dict, Iterable, Tuple
 from urllib import request as urllib_request
 from urllib.error import URLError
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 logger = logging.getLogger(__name__)
 
 RATE_PER_DOMAIN = 1.0  # seconds between two requests to the same domain
 _CACHE_SUFFIX = ".html"
+_CHUNK_SIZE = 64 * 1024
+_DEFAULT_PORTS = {"http": 80, "https": 443}
 
 
 class DomainRateLimiter:
-    """Co-ordinate access to individual domains."""
+    """Co-ordinate access to individual domains.
+
+    A single instance may be shared across successive :func:`asyncio.run`
+    calls: request timestamps persist while the per-domain locks, which are
+    bound to an event loop, are recreated whenever the running loop changes.
+    """
 
     def __init__(self, delay: float = RATE_PER_DOMAIN):
         self.delay = max(0.0, delay)
         self._locks: dict[str, asyncio.Lock] = {}
         self._last_seen: dict[str, float] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def wait(self, domain: str) -> None:
         """Wait until the rate limit for *domain* allows another request."""
 
         if self.delay <= 0:
             return
-        lock = self._locks.setdefault(domain, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._locks = {}
+        lock = self._locks.get(domain)
+        if lock is None:
+            # Avoid allocating a throwaway lock on every call via ``setdefault``.
+            lock = self._locks.setdefault(domain, asyncio.Lock())
         async with lock:
-            loop = asyncio.get_running_loop()
-            now = loop.time()
-            last = self._last_seen.get(domain, 0.0)
-            sleep_for = self.delay - (now - last)
-            if sleep_for > 0:
-                await asyncio.sleep(sleep_for)
-            self._last_seen[domain] = loop.time()
+            last = self._last_seen.get(domain)
+            if last is not None:
+                sleep_for = self.delay - (time.monotonic() - last)
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+            self._last_seen[domain] = time.monotonic()
+
+
+_LIMITER = DomainRateLimiter()
+
+
+def _normalise_url(url: str) -> str:
+    """Return a canonical form of *url* used to detect equivalent inputs.
+
+    Scheme and host are lower-cased, default ports and fragments are dropped,
+    query parameters are sorted and an empty path becomes ``/``.
+    """
+
+    parsed = urlparse(url.strip())
+    try:
+        port = parsed.port
+    except ValueError:
+        # Malformed port: keep the URL as its own group and let the download
+        # report the failure like any other bad input.
+        return url.strip()
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parsed.username or parsed.password:
+        userinfo = parsed.username or ""
+        if parsed.password:
+            userinfo = f"{userinfo}:{parsed.password}"
+        netloc = f"{userinfo}@{netloc}"
+    path = parsed.path or ("/" if netloc else "")
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, netloc, path, parsed.params, query, ""))
 
 
 def _cache_key(url: str) -> str:
@@ -55,11 +105,29 @@ def _cache_path(cache_dir: Path, url: str) -> Path:
     return cache_dir / f"{_cache_key(url)}{_CACHE_SUFFIX}"
 
 
-def _fetch_sync(url: str) -> bytes:
-    """Blocking helper executed in a thread to download *url*."""
+def _fetch_sync(url: str, destination: Path) -> Tuple[int, str]:
+    """Blocking helper executed in a thread to download *url*.
 
-    with urllib_request.urlopen(url) as response:  # type: ignore[arg-type]
-        return response.read()
+    The body is streamed to a temporary file next to *destination* in
+    :data:`_CHUNK_SIZE` blocks while its SHA-256 digest is computed, then moved
+    into place atomically.  Returns the number of bytes written and the digest.
+    """
+
+    digest = hashlib.sha256()
+    size = 0
+    partial = destination.with_name(destination.name + ".part")
+    try:
+        with urllib_request.urlopen(url) as response:  # type: ignore[arg-type]
+            with partial.open("wb") as handle:
+                while chunk := response.read(_CHUNK_SIZE):
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size += len(chunk)
+        os.replace(partial, destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return size, digest.hexdigest()
 
 
 async def _download(
@@ -78,7 +146,7 @@ async def _download(
     await limiter.wait(domain)
 
     try:
-        content = await asyncio.to_thread(_fetch_sync, url)
+        size, digest = await asyncio.to_thread(_fetch_sync, url, cache_file)
     except URLError as exc:
         logger.warning("failed to fetch %s: %s", url, exc.reason)
         return url, None
@@ -86,18 +154,26 @@ async def _download(
         logger.warning("failed to fetch %s: %s", url, exc)
         return url, None
 
-    cache_file.write_bytes(content)
-    logger.info("fetched %s -> %s", url, cache_file)
+    logger.info(
+        "fetched %s -> %s (%d bytes, sha256 %s)", url, cache_file, size, digest
+    )
     return url, str(cache_file)
 
 
-async def scrape_all(
+async def iter_scrape(
     urls: Iterable[str],
     cache_dir: Path,
     *,
     concurrency: int = 5,
-) -> Dict[str, str]:
-    """Fetch *urls* concurrently and return a mapping to cached files."""
+    limiter: DomainRateLimiter | None = None,
+) -> AsyncIterator[Tuple[str, str]]:
+    """Yield ``(url, cached_path)`` pairs as soon as each download completes.
+
+    Failed downloads are skipped.  Callers can ingest results incrementally
+    instead of waiting for the slowest URL of the batch.  Unless *limiter* is
+    given, the process-wide limiter is used so politeness delays hold across
+    back-to-back scrapes of the same domains.
+    """
 
     if concurrency < 1:
         raise ValueError("concurrency must be >= 1")
@@ -105,16 +181,49 @@ async def scrape_all(
     cache_dir = Path(cache_dir)
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    limiter = DomainRateLimiter()
+    limiter = limiter or _LIMITER
     semaphore = asyncio.Semaphore(concurrency)
 
-    async def _run(url: str) -> Tuple[str, str | None]:
+    async def _run(aliases: list[str]) -> Tuple[list[str], str | None]:
         async with semaphore:
-            return await _download(url, cache_dir, limiter)
+            _, path = await _download(aliases[0], cache_dir, limiter)
+            return aliases, path
+
+    # Equivalent URLs (``http://x`` vs ``http://x/``) are fetched only once and
+    # every original spelling is mapped to the shared cached file.
+    groups: dict[str, list[str]] = {}
+    for url in urls:
+        groups.setdefault(_normalise_url(url), []).append(url)
+
+    tasks = [asyncio.create_task(_run(aliases)) for aliases in groups.values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            aliases, path = await next_done
+            if path is None:
+                continue
+            for url in aliases:
+                yield url, path
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def scrape_all(
+    urls: Iterable[str],
+    cache_dir: Path,
+    *,
+    concurrency: int = 5,
+    limiter: DomainRateLimiter | None = None,
+) -> Dict[str, str]:
+    """Fetch *urls* concurrently and return a mapping to cached files."""
 
-    tasks = [asyncio.create_task(_run(url)) for url in urls]
-    results = await asyncio.gather(*tasks)
-    return {url: path for url, path in results if path is not None}
+    return {
+        url: path
+        async for url, path in iter_scrape(
+            urls, cache_dir, concurrency=concurrency, limiter=limiter
+        )
+    }
 
 
 async def scrape(
@@ -136,4 +245,4 @@ async def scrape(
     return await scrape_all(urls, cache_dir, concurrency=concurrency)
 
 
-__all__ = ["scrape_all", "scrape", "DomainRateLimiter"]
+__all__ = ["iter_scrape", "scrape_all", "scrape", "DomainRateLimiter"]
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -278,11 +277,9 @@ class IngestPipeline:
 
 
 def _normalise_text(text: str) -> str:
-    text = text.strip()
-    if not text:
-        return ""
-    text = re.sub(r"\s+", " ", text)
-    return text
+    # ``str.split()`` collapses the same Unicode whitespace as ``\s+`` in a
+    # single C-level pass and drops leading/trailing runs.
+    return " ".join(text.split())
 
 
 def _detect_language(text: str) -> str:
@@ -301,7 +298,7 @@ def _detect_language(text: str) -> str:
 
 
 def _chunk_text(text: str, chunk_size: int, chunk_overlap: int = 0) -> list[str]:
-    words = text.split(" ")
+    words = text.split()
     if not words:
         return []
     chunks: list[str] = []
@@ -2,83 +2,354 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
 import http.client
+import io
 import json
 import logging
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
+from typing import Any, Iterator
 from urllib.parse import urlparse
 
 from config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 try:  # pragma: no cover - optional dependency
     from llama_cpp import Llama  # type: ignore[import-not-found]
 except Exception:  # pragma: no cover - optional dependency
     Llama = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional dependency
+    from llama_cpp import LlamaRAMCache  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - optional dependency
+    LlamaRAMCache = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_dumps(payload: object) -> bytes:
+    """Serialise *payload* to UTF-8 JSON, using :mod:`orjson` when installed."""
 
-def validate_prompt(prompt: str) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON *data*, using :mod:`orjson` when installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def validate_prompt(prompt: str, *, max_chars: int | None = None) -> str:
     """Return a sanitized version of *prompt*.
 
     Leading and trailing whitespace is stripped and an empty prompt raises a
-    ``ValueError``.
+    ``ValueError``. When *max_chars* is given, longer prompts are rejected as
+    well.
     """
     prompt = prompt.strip()
     if not prompt:
         raise ValueError("prompt must not be empty")
+    _check_prompt_size(prompt, max_chars)
     return prompt
 
 
-def generate_ollama(prompt: str, *, host: str, model: str) -> str:
-    """Send *prompt* to an Ollama server.
+def _check_prompt_size(prompt: str, max_chars: int | None) -> None:
+    if max_chars is not None and len(prompt) > max_chars:
+        raise ValueError(f"prompt exceeds the {max_chars} characters limit")
+
+
+_CONNECTION_TIMEOUT = 30
+_POOL_MAXSIZE = 10
+_MAX_CONCURRENT_CHUNKS = 8
+_LLAMA_STATE_CACHE_BYTES = 256 * 1024 * 1024
+# Rough prompt budget used to decide whether chunking is needed at all.
+_CHARS_PER_TOKEN = 4
+_CTX_HEADROOM = 0.9
+_pool_lock = threading.Lock()
+_idle_connections: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+
+
+def _acquire_connection(
+    scheme: str, hostname: str, port: int
+) -> tuple[http.client.HTTPConnection, bool]:
+    """Return a connection for the target and whether it came from the pool."""
+
+    with _pool_lock:
+        idle = _idle_connections.get((scheme, hostname, port))
+        if idle:
+            return idle.pop(), True
+    return _open_connection(scheme, hostname, port), False
+
+
+def _open_connection(
+    scheme: str, hostname: str, port: int
+) -> http.client.HTTPConnection:
+    if scheme == "https":
+        return http.client.HTTPSConnection(
+            hostname, port, timeout=_CONNECTION_TIMEOUT
+        )
+    return http.client.HTTPConnection(hostname, port, timeout=_CONNECTION_TIMEOUT)
+
+
+def _release_connection(
+    key: tuple[str, str, int], conn: http.client.HTTPConnection
+) -> None:
+    """Return *conn* to the pool, closing it when the pool is already full."""
+
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < _POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    _close_quietly(conn)
 
-    Args:
-        prompt: Text prompt to send for generation.
-        host: Hostname (and optional port) of the Ollama server.
-        model: Model identifier used for the request.
 
-    The response value is returned as a stripped string.
+def _close_quietly(conn: http.client.HTTPConnection) -> None:
+    try:
+        conn.close()
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+
+def close_connections() -> None:
+    """Close every idle pooled connection to the Ollama servers."""
+
+    with _pool_lock:
+        pooled = [conn for idle in _idle_connections.values() for conn in idle]
+        _idle_connections.clear()
+    for conn in pooled:
+        _close_quietly(conn)
+
+
+# Send FIN to the server on interpreter shutdown instead of leaking sockets.
+atexit.register(close_connections)
+
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _chunk_executor() -> ThreadPoolExecutor:
+    """Return the process-wide worker pool used to fan out prompt chunks.
+
+    Reusing one pool avoids spawning and joining threads on every
+    :meth:`Client.generate` call.
+    """
+
+    global _executor
+    if _executor is None:
+        with _pool_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_CHUNKS,
+                    thread_name_prefix="ollama-chunk",
+                )
+    return _executor
+
+
+@lru_cache(maxsize=32)
+def _resolve_target(host: str) -> tuple[str, str, int]:
+    """Return the ``(scheme, hostname, port)`` triple for an Ollama *host*.
+
+    The result only depends on the configured host string, so it is parsed
+    once instead of on every chunk request.
     """
 
     parsed = urlparse(host if "://" in host else f"http://{host}")
-    scheme = parsed.scheme or "http"
-    if scheme == "https":
-        connection_cls = http.client.HTTPSConnection
-        default_port = 443
-    else:
-        connection_cls = http.client.HTTPConnection
-        default_port = 11434
-
-    conn = connection_cls(
-        parsed.hostname or "127.0.0.1", parsed.port or default_port, timeout=30
+    scheme = "https" if parsed.scheme == "https" else "http"
+    default_port = 443 if scheme == "https" else 11434
+    return scheme, parsed.hostname or "127.0.0.1", parsed.port or default_port
+
+
+def prewarm_connection(host: str) -> None:
+    """Open a keep-alive connection to *host* and park it in the pool.
+
+    Only the TCP (and TLS) handshake is performed, so the first
+    :func:`generate_ollama` call skips that round-trip. Failures are logged
+    and otherwise ignored so offline setups are unaffected.
+    """
+
+    key = _resolve_target(host)
+    conn = _open_connection(*key)
+    try:
+        conn.connect()
+    except OSError as exc:
+        logger.debug("Ollama pre-connection to %s failed: %s", host, exc)
+        _close_quietly(conn)
+        return
+    _release_connection(key, conn)
+
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _post_generate(
+    conn: http.client.HTTPConnection, payload: bytes, path: str = "/api/generate"
+) -> http.client.HTTPResponse:
+    conn.request(
+        "POST",
+        path,
+        body=payload,
+        headers={"Content-Type": "application/json"},
     )
+    return conn.getresponse()
+
+
+def post_ollama(host: str, path: str, payload: bytes) -> tuple[int, bytes]:
+    """POST JSON *payload* to *path* on an Ollama *host*.
+
+    The request goes through the same keep-alive pool as
+    :func:`generate_ollama` and the ``(status, body)`` pair is returned.
+    """
+
+    key = _resolve_target(host)
+    conn, reused = _acquire_connection(*key)
+    reusable = False
     try:  # pragma: no cover - network path
-        payload = json.dumps({"model": model, "prompt": prompt})
-        conn.request(
-            "POST",
-            "/api/generate",
-            body=payload,
-            headers={"Content-Type": "application/json"},
-        )
-        resp = conn.getresponse()
+        try:
+            resp = _post_generate(conn, payload, path)
+        except _STALE_CONNECTION_ERRORS:
+            if not reused:
+                raise
+            _close_quietly(conn)
+            conn = _open_connection(*key)
+            resp = _post_generate(conn, payload, path)
+        body = resp.read()
+        reusable = not getattr(resp, "will_close", False)
+        return resp.status, body
+    finally:
+        if reusable:
+            _release_connection(key, conn)
+        else:
+            _close_quietly(conn)
+
+
+def stream_ollama(prompt: str, *, host: str, model: str) -> Iterator[str]:
+    """Yield response fragments for *prompt* as an Ollama server produces them.
+
+    The request is sent with ``stream: true`` and each NDJSON line is parsed as
+    soon as it arrives, so callers see the first tokens without waiting for
+    the whole generation. The pooled connection is only reused once the
+    response has been fully consumed.
+    """
+
+    key = _resolve_target(host)
+    conn, reused = _acquire_connection(*key)
+    reusable = False
+    try:  # pragma: no cover - network path
+        payload = _json_dumps({"model": model, "prompt": prompt, "stream": True})
+        try:
+            resp = _post_generate(conn, payload)
+        except _STALE_CONNECTION_ERRORS:
+            if not reused:
+                raise
+            # The server dropped the idle keep-alive socket: reconnect once.
+            _close_quietly(conn)
+            conn = _open_connection(*key)
+            resp = _post_generate(conn, payload)
         if resp.status != 200:
+            resp.read()
             raise RuntimeError(f"Generate request failed: {resp.status}")
-        data = json.loads(resp.read())
-        return data.get("response", "").strip()
+        while line := resp.readline():
+            if not line.strip():
+                continue
+            data = _json_loads(line)
+            if data.get("error"):
+                raise RuntimeError(f"Generate request failed: {data['error']}")
+            fragment = data.get("response", "")
+            if fragment:
+                yield fragment
+            if data.get("done"):
+                break
+        # Drain the remainder so the connection can serve the next request.
+        resp.read()
+        reusable = not getattr(resp, "will_close", False)
     finally:
-        try:
-            conn.close()
-        except Exception:  # pragma: no cover - defensive
-            pass
+        if reusable:
+            _release_connection(key, conn)
+        else:
+            _close_quietly(conn)
 
 
-def chunk_prompt(prompt: str, *, size: int = 1000) -> list[str]:
-    """Yield slices of *prompt* of at most *size* characters."""
+def generate_ollama(prompt: str, *, host: str, model: str) -> str:
+    """Send *prompt* to an Ollama server.
+
+    Args:
+        prompt: Text prompt to send for generation.
+        host: Hostname (and optional port) of the Ollama server.
+        model: Model identifier used for the request.
+
+    Connections are kept alive in a small per-host pool so consecutive calls
+    (for instance one per prompt chunk) reuse the same TCP/TLS session. The
+    streamed fragments are joined and returned as a stripped string.
+    """
+
+    return "".join(stream_ollama(prompt, host=host, model=model)).strip()
+
+
+# Per-chunk trace labels are preformatted for typical prompt sizes.
+_OLLAMA_LABELS = tuple(f"ollama:{idx}" for idx in range(256))
+_LLAMA_LABELS = tuple(f"llama.cpp:{idx}" for idx in range(256))
+
+
+def _trace_label(labels: tuple[str, ...], backend: str, idx: int) -> str:
+    return labels[idx] if idx < len(labels) else f"{backend}:{idx}"
+
+
+def _resolve_quantized(model_path: Path, quantization: str | None) -> Path:
+    """Return the *quantization* variant of *model_path* when it exists.
+
+    ``models/foo.Q8_0.gguf`` with ``Q4_K_M`` resolves to
+    ``models/foo.Q4_K_M.gguf`` (or ``models/foo.Q8_0.Q4_K_M.gguf``) if such a
+    file is present; otherwise the configured path is returned unchanged.
+    """
+
+    if not quantization:
+        return model_path
+    stem = model_path.stem
+    bases = [stem.rsplit(".", 1)[0]] if "." in stem else []
+    bases.append(stem)
+    for base in bases:
+        candidate = model_path.with_name(f"{base}.{quantization}{model_path.suffix}")
+        if candidate.is_file():
+            return candidate
+    return model_path
+
+
+def iter_chunks(prompt: str, *, size: int = 1000) -> Iterator[str]:
+    """Lazily yield slices of *prompt* of at most *size* characters.
+
+    The size is validated immediately so misuse fails at the call site rather
+    than on first iteration.
+    """
     if size <= 0:
         raise ValueError("size must be a positive integer")
-    return [prompt[i : i + size] for i in range(0, len(prompt), size)]
+    return (prompt[i : i + size] for i in range(0, len(prompt), size))
+
+
+def chunk_prompt(prompt: str, *, size: int = 1000) -> list[str]:
+    """Return slices of *prompt* of at most *size* characters."""
+    return list(iter_chunks(prompt, size=size))
 
 
 class Client:
@@ -131,6 +402,11 @@ class Client:
             raise ValueError(f"Unsupported LLM backend: {backend}")
 
         self.backend = backend
+        # Resolve the backend dispatch once instead of on every ``generate``.
+        self._local_backend = backend == "llama.cpp"
+        self._generate_backend = (
+            self._generate_llama_cpp if self._local_backend else self._generate_ollama
+        )
         self.model = llm_model
         self.host = host or llm_cfg.host
         self.ctx = ctx if ctx is not None else llm_cfg.ctx
@@ -139,7 +415,9 @@ class Client:
         self.max_tokens = int(llm_cfg.max_tokens)
         self.system_prompt = llm_cfg.system_prompt
         self.model_path = (
-            settings.paths.resolve(llm_cfg.model_path)
+            _resolve_quantized(
+                settings.paths.resolve(llm_cfg.model_path), llm_cfg.quantization
+            )
             if backend == "llama.cpp"
             else llm_cfg.model_path
         )
@@ -149,9 +427,45 @@ class Client:
             if threads is not None
             else max(1, os.cpu_count() or 1)
         )
+        self.threads_batch = (
+            llm_cfg.threads_batch
+            if llm_cfg.threads_batch is not None
+            else self.threads
+        )
+        self.batch_size = int(llm_cfg.batch_size)
+        self.ubatch_size = int(llm_cfg.ubatch_size)
+        self.mlock = bool(llm_cfg.mlock)
+        self.max_prompt_chars = int(llm_cfg.max_prompt_chars)
+        self.cache_size = int(llm_cfg.cache_size)
+        self.cache_ttl = float(llm_cfg.cache_ttl)
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._response_cache: OrderedDict[bytes, tuple[float | None, str]] = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
         self._offline = False
         self._llama_lock = threading.RLock()
         self._llama_model: Llama | None = None
+        self._preload_thread: threading.Thread | None = None
+        if (
+            backend == "llama.cpp"
+            and Llama is not None
+            and Path(self.model_path).is_file()
+        ):
+            # Load the weights off the request path so the first ``generate``
+            # call does not pay for it; callers block on the lock meanwhile.
+            self._preload_thread = threading.Thread(
+                target=self._preload_llama, name="llama-preload", daemon=True
+            )
+            self._preload_thread.start()
+        elif backend == "ollama" and llm_cfg.prewarm:
+            self._preload_thread = threading.Thread(
+                target=prewarm_connection,
+                args=(self.host,),
+                name="ollama-prewarm",
+                daemon=True,
+            )
+            self._preload_thread.start()
 
     def set_offline(self, offline: bool) -> None:
         """Enable or disable offline mode for the client."""
@@ -166,82 +480,229 @@ class Client:
             separator: String inserted between responses for each chunk when
                 concatenated. Defaults to ``""``.
 
-        The prompt is sent in fixed-size chunks so very large prompts can be
-        handled without overwhelming the backend. Successful responses from
-        each chunk are concatenated before being returned.
+        With the Ollama backend, a prompt that fits about 90% of the context
+        window (``llm.ctx``) is sent as a single request. Longer prompts, and
+        every prompt on the llama.cpp backend, are sent in fixed-size chunks
+        so the backend is not overwhelmed. Successful responses from each
+        chunk are concatenated before being returned.
+
+        Raises:
+            ValueError: If *prompt* is longer than ``llm.max_prompt_chars``.
         """
 
+        # Fail fast before chunking (or echoing) pathologically large input.
+        _check_prompt_size(prompt, self.max_prompt_chars)
         trace: list[str] = []
-        backend = getattr(self, "backend", "ollama")
-        if self._offline and backend != "llama.cpp":
+        if self._offline and not self._local_backend:
             trace.extend(["offline", "fallback"])
             return f"{self.fallback_phrase}: {prompt}", " -> ".join(trace)
 
         try:  # pragma: no cover - network path
-            if backend == "llama.cpp":
-                response = self._generate_llama_cpp(prompt, separator, trace)
-            else:
-                response = self._generate_ollama(prompt, separator, trace)
+            response = self._generate_backend(prompt, separator, trace)
             trace.append("success")
             return response, " -> ".join(trace)
         except Exception as exc:
             trace.append(f"error:{exc.__class__.__name__}")
             trace.append("fallback")
-            logging.exception("Failed to generate response: %s", exc)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("Failed to generate response: %s", exc)
+            else:
+                # Skip traceback capture on the degraded-network hot path.
+                logger.warning(
+                    "Failed to generate response: %s: %s",
+                    exc.__class__.__name__,
+                    exc,
+                )
             return f"{self.fallback_phrase}: {prompt}", " -> ".join(trace)
 
+    # ------------------------------------------------------------------
+    # Response cache
+
+    def _cache_enabled(self) -> bool:
+        """Return whether answers may be replayed from the cache.
+
+        Only deterministic decoding (``temperature == 0``) is cached: with
+        sampling, replaying a stored answer would hide the model's variance.
+        """
+
+        return self.cache_size > 0 and self.temperature == 0
+
+    def _cache_key(self, chunk: str) -> bytes:
+        """Return a compact digest identifying *chunk* for this configuration."""
+
+        material = "|".join(
+            (self.model, str(self.ctx), self.system_prompt, chunk)
+        ).encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).digest()
+
+    def _cached_response(self, chunk: str) -> str | None:
+        """Return the cached answer for *chunk* and mark it recently used."""
+
+        if not self._cache_enabled():
+            return None
+        key = self._cache_key(chunk)
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._response_cache.move_to_end(key)
+                    self.cache_stats["hits"] += 1
+                    return response
+                del self._response_cache[key]
+            self.cache_stats["misses"] += 1
+            return None
+
+    def _store_response(self, chunk: str, response: str) -> None:
+        """Remember *response* for *chunk*, evicting the least recent entry."""
+
+        if not self._cache_enabled():
+            return
+        key = self._cache_key(chunk)
+        expires_at = (
+            time.monotonic() + self.cache_ttl if self.cache_ttl > 0 else None
+        )
+        with self._cache_lock:
+            self._response_cache[key] = (expires_at, response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Backend specific helpers
 
+    def _fits_context(self, prompt: str) -> bool:
+        """Return whether *prompt* likely fits the model context window."""
+
+        if not self.ctx:
+            return False
+        return len(prompt) < self.ctx * _CTX_HEADROOM * _CHARS_PER_TOKEN
+
     def _generate_ollama(
         self, prompt: str, separator: str, trace: list[str]
     ) -> str:
-        responses: list[str] = []
-        for idx, chunk in enumerate(chunk_prompt(prompt)):
-            trace.append(f"ollama:{idx}")
-            responses.append(
-                generate_ollama(chunk, host=self.host, model=self.model)
-            )
-        return separator.join(responses)
+        def _send(chunk: str) -> str:
+            cached = self._cached_response(chunk)
+            if cached is not None:
+                return cached
+            response = generate_ollama(chunk, host=self.host, model=self.model)
+            self._store_response(chunk, response)
+            return response
+
+        if self._fits_context(prompt):
+            # The whole prompt fits the context window: one request keeps it
+            # coherent and avoids N model invocations.
+            trace.append(_OLLAMA_LABELS[0])
+            return _send(prompt)
+
+        chunks = iter_chunks(prompt)
+        head = list(islice(chunks, 2))
+        if len(head) <= 1:
+            trace.extend(_OLLAMA_LABELS[: len(head)])
+            return separator.join(map(_send, head))
+        # Chunks are independent prompts: dispatch them concurrently over the
+        # pooled connections, pulling new slices only as earlier ones complete
+        # so at most a bounded window of chunks is in flight.
+        window = 2 * _MAX_CONCURRENT_CHUNKS
+        pending: deque[Future[str]] = deque()
+        output = io.StringIO()
+        written = 0
+
+        def _write_next() -> None:
+            nonlocal written
+            if written:
+                output.write(separator)
+            output.write(pending.popleft().result())
+            written += 1
+
+        submitted: dict[str, Future[str]] = {}
+        executor = _chunk_executor()
+        try:
+            for idx, chunk in enumerate(chain(head, chunks)):
+                trace.append(_trace_label(_OLLAMA_LABELS, "ollama", idx))
+                # Repeated boilerplate chunks share one in-flight request.
+                future = submitted.get(chunk)
+                if future is None:
+                    future = submitted[chunk] = executor.submit(_send, chunk)
+                pending.append(future)
+                if len(pending) >= window:
+                    _write_next()
+            while pending:
+                _write_next()
+        finally:
+            for future in pending:
+                future.cancel()
+        return output.getvalue()
+
+    def _preload_llama(self) -> None:
+        try:
+            self._ensure_llama()
+        except Exception as exc:  # pragma: no cover - surfaced again on use
+            logger.debug("llama.cpp preload failed: %s", exc)
 
     def _ensure_llama(self) -> Llama:
+        # Fast path: once loaded, the model is returned without taking the lock
+        # or touching the filesystem.
+        model = self._llama_model
+        if model is not None:
+            return model
+
         if Llama is None:  # pragma: no cover - dependency missing
             raise RuntimeError(
                 "llama-cpp-python is required but not installed. "
                 "Ajoutez 'llama-cpp-python' à vos dépendances."
             )
 
-        model_path = Path(self.model_path)
-        if not model_path.is_file():
-            raise FileNotFoundError(
-                f"Le modèle llama.cpp est introuvable: {model_path}"
-            )
-
         with self._llama_lock:
             if self._llama_model is None:
+                model_path = Path(self.model_path)
+                if not model_path.is_file():
+                    raise FileNotFoundError(
+                        f"Le modèle llama.cpp est introuvable: {model_path}"
+                    )
                 kwargs = {
                     "model_path": str(model_path),
                     "n_ctx": int(self.ctx or 2048),
                     "n_threads": int(self.threads),
+                    "n_threads_batch": int(self.threads_batch),
+                    "n_batch": int(self.batch_size),
+                    "n_ubatch": int(self.ubatch_size),
+                    "use_mmap": True,
+                    "use_mlock": bool(self.mlock),
                 }
-                self._llama_model = Llama(**kwargs)
-        return self._llama_model
+                llama = Llama(**kwargs)
+                if LlamaRAMCache is not None:
+                    # Keep KV states keyed by token prefix so the shared system
+                    # prompt is not evaluated again for every chunk, even when
+                    # other prompts were processed in between.
+                    llama.set_cache(
+                        LlamaRAMCache(capacity_bytes=_LLAMA_STATE_CACHE_BYTES)
+                    )
+                self._llama_model = llama
+            return self._llama_model
 
     def _generate_llama_cpp(
         self, prompt: str, separator: str, trace: list[str]
     ) -> str:
         llama = self._ensure_llama()
-        responses: list[str] = []
-        for idx, chunk in enumerate(chunk_prompt(prompt)):
-            trace.append(f"llama.cpp:{idx}")
-            completion = llama.create_chat_completion(
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": chunk},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
-            choice = completion["choices"][0]["message"]["content"]
-            responses.append(str(choice).strip())
-        return separator.join(responses)
+        system_message = {"role": "system", "content": self.system_prompt}
+        output = io.StringIO()
+        answered: dict[str, str] = {}
+        for idx, chunk in enumerate(iter_chunks(prompt)):
+            trace.append(_trace_label(_LLAMA_LABELS, "llama.cpp", idx))
+            if idx:
+                output.write(separator)
+            choice = answered.get(chunk)
+            if choice is None:
+                choice = self._cached_response(chunk)
+            if choice is None:
+                completion = llama.create_chat_completion(
+                    messages=[system_message, {"role": "user", "content": chunk}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
+                choice = str(completion["choices"][0]["message"]["content"]).strip()
+                self._store_response(chunk, choice)
+            answered[chunk] = choice
+            output.write(choice)
+        return output.getvalue()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Sequence
 
 from app.embeddings.store import SimpleVectorStore
@@ -10,16 +11,46 @@ from app.llm.client import Client
 
 logger = logging.getLogger(__name__)
 
+_PROMPT_TEMPLATE = (
+    "{header}\n\nQuestion: {question}\n"
+    "Réponds en expliquant brièvement quelles sources tu utilises."
+)
+
+_default_lock = threading.Lock()
+_default_client: Client | None = None
+_default_store: SimpleVectorStore | None = None
+
+
+def _get_default_client() -> Client:
+    """Return the process-wide client shared by :func:`answer_question`."""
+
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def _get_default_store() -> SimpleVectorStore:
+    """Return the process-wide vector store shared by :func:`answer_question`."""
+
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = SimpleVectorStore()
+    return _default_store
+
 
 def build_prompt(question: str, passages: Sequence[str]) -> str:
+    # ``str.join`` materialises its argument anyway; a list skips the
+    # generator round-trips when many passages are retrieved.
     context = "\n\n".join(
-        f"PASSAGE {i + 1}:\n{content}" for i, content in enumerate(passages) if content
+        [f"PASSAGE {i}:\n{content}" for i, content in enumerate(passages, 1) if content]
     )
     header = "Contexte:\n" + context if context else "Contexte: (aucun)"
-    return (
-        f"{header}\n\nQuestion: {question}\n"
-        "Réponds en expliquant brièvement quelles sources tu utilises."
-    )
+    return _PROMPT_TEMPLATE.format(header=header, question=question)
 
 
 def answer_question(
@@ -29,11 +60,16 @@ def answer_question(
     client: Client | None = None,
     store: SimpleVectorStore | None = None,
 ) -> str:
-    vector_store = store or SimpleVectorStore()
+    vector_store = store or _get_default_store()
     hits = vector_store.search(question, k=k)
     passages = [item[0].get("text", "") for item in hits if item[0].get("text")]
+    llm = client or _get_default_client()
     prompt = build_prompt(question, passages)
+    # Drop the least relevant passages until the prompt fits the client limit.
+    limit = getattr(llm, "max_prompt_chars", None)
+    while limit is not None and passages and len(prompt) > limit:
+        passages.pop()
+        prompt = build_prompt(question, passages)
     logger.debug("Prompt length %d", len(prompt))
-    llm = client or Client()
     answer, _ = llm.generate(prompt, separator="\n")
     return answer
@@ -5,8 +5,9 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
-from datetime import datetime, timezone
+import time
 from pathlib import Path
+from typing import BinaryIO, Iterable
 
 
 class LedgerError(RuntimeError):
@@ -16,10 +17,7 @@ class LedgerError(RuntimeError):
 def _utc_timestamp() -> str:
     """Return a UTC timestamp using the persisted ``...Z`` format."""
 
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace(
-        "+00:00",
-        "Z",
-    )
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 class ConsentLedger:
@@ -32,6 +30,27 @@ class ConsentLedger:
         if not isinstance(secret_hex, str):  # pragma: no cover - defensive
             raise LedgerError("ledger metadata missing secret_hex")
         self._secret = bytes.fromhex(secret_hex)
+        self._fh: BinaryIO | None = None
+
+    def __enter__(self) -> "ConsentLedger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the append handle kept open between :meth:`record` calls."""
+
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _handle(self) -> BinaryIO:
+        if self._fh is None:
+            # Unbuffered append mode: every entry reaches the file in a single
+            # write() without re-opening it for each record.
+            self._fh = self.path.open("ab", buffering=0)
+        return self._fh
 
     def _read_metadata(self) -> dict[str, object]:
         if not self.path.exists():
@@ -51,6 +70,29 @@ class ConsentLedger:
         return dict(self._metadata)
 
     def record(self, *, action: str, domain: str, scope: str, policy_hash: str) -> None:
+        self._handle().write(
+            self._entry_line(
+                action=action, domain=domain, scope=scope, policy_hash=policy_hash
+            )
+        )
+
+    def record_many(
+        self, *, action: str, entries: Iterable[tuple[str, str]], policy_hash: str
+    ) -> None:
+        """Append one signed entry per ``(domain, scope)`` in a single write."""
+
+        lines = b"".join(
+            self._entry_line(
+                action=action, domain=domain, scope=scope, policy_hash=policy_hash
+            )
+            for domain, scope in entries
+        )
+        if lines:
+            self._handle().write(lines)
+
+    def _entry_line(
+        self, *, action: str, domain: str, scope: str, policy_hash: str
+    ) -> bytes:
         payload = {
             "type": "entry",
             "timestamp": _utc_timestamp(),
@@ -61,7 +103,6 @@ class ConsentLedger:
         }
         message = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
         signature = hmac.new(self._secret, message, hashlib.sha256).hexdigest()
-        payload["signature"] = signature
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
+        # Reuse the canonical signed bytes for the stored line instead of
+        # serialising the payload a second time; only the signature is added.
+        return message[:-1] + b', "signature": "' + signature.encode("ascii") + b'"}\n'
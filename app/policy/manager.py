@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 import yaml
 
 from pydantic import ValidationError
@@ -10,6 +12,11 @@ from pydantic import ValidationError
 from .ledger import ConsentLedger, LedgerError
 from .schema import DomainPolicyRule, Policy
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure Python fallback
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 class PolicyError(RuntimeError):
     """Raised when the policy file is missing or malformed."""
@@ -32,6 +39,9 @@ class PolicyManager:
         self.config_dir = self.home / ".watcher"
         self.policy_path = self.config_dir / "policy.yaml"
         self.ledger_path = self.config_dir / "consents.jsonl"
+        # (st_mtime_ns, st_size, raw bytes, sha256 hex, parsed policy)
+        self._cache: tuple[int, int, bytes, str, Policy] | None = None
+        self._ledger: ConsentLedger | None = None
         legacy_ledger = self.config_dir / "consent-ledger.jsonl"
         if legacy_ledger.exists() and not self.ledger_path.exists():
             try:
@@ -41,14 +51,37 @@ class PolicyManager:
                 # regressing behaviour for existing users.
                 self.ledger_path = legacy_ledger
 
-    def _read_policy(self) -> Policy:
-        if not self.policy_path.exists():
-            raise PolicyError(
-                "policy.yaml is missing – run 'watcher init --fully-auto'"
-            )
-        text = self.policy_path.read_text(encoding="utf-8")
+    def _snapshot(self) -> tuple[int, int, bytes, str, Policy]:
+        """Return the cached policy state, re-reading it only when it changed."""
+
+        st = self.policy_path.stat()
+        cache = self._fresh_cache(st)
+        if cache is not None:
+            return cache
+        raw = self.policy_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        previous = self._cache
+        if previous is not None and previous[3] == digest:
+            # Touched but unchanged (e.g. rewritten with identical content):
+            # the already validated model is still accurate.
+            policy = previous[4]
+        else:
+            policy = self._parse(raw)
+        self._cache = (st.st_mtime_ns, st.st_size, raw, digest, policy)
+        return self._cache
+
+    def _fresh_cache(
+        self, st: os.stat_result
+    ) -> tuple[int, int, bytes, str, Policy] | None:
+        cache = self._cache
+        if cache is not None and cache[:2] == (st.st_mtime_ns, st.st_size):
+            return cache
+        return None
+
+    @staticmethod
+    def _parse(raw: bytes) -> Policy:
         try:
-            data = yaml.safe_load(text) or {}
+            data = yaml.load(raw, Loader=_SafeLoader) or {}
         except yaml.YAMLError as exc:  # pragma: no cover - defensive
             raise PolicyError("policy.yaml is not valid YAML") from exc
 
@@ -57,21 +90,43 @@ class PolicyManager:
         except ValidationError as exc:
             raise PolicyError("policy.yaml is invalid") from exc
 
+    def _current_policy(self) -> Policy:
+        """Return the shared cached policy; callers must not mutate it."""
+
+        if not self.policy_path.exists():
+            raise PolicyError(
+                "policy.yaml is missing – run 'watcher init --fully-auto'"
+            )
+        return self._snapshot()[4]
+
+    def _read_policy(self) -> Policy:
+        # Callers mutate the returned model, so hand out a private copy.
+        return self._current_policy().model_copy(deep=True)
+
     def _write_policy(self, policy: Policy) -> None:
+        self._cache = None
         data = policy.to_dict()
-        self.policy_path.write_text(
-            yaml.safe_dump(data, sort_keys=False),
-            encoding="utf-8",
+        raw = yaml.dump(data, Dumper=_SafeDumper, sort_keys=False, encoding="utf-8")
+        self.policy_path.write_bytes(raw)
+        st = self.policy_path.stat()
+        digest = hashlib.sha256(raw).hexdigest()
+        self._cache = (
+            st.st_mtime_ns,
+            st.st_size,
+            raw,
+            digest,
+            policy.model_copy(deep=True),
         )
 
     def _policy_hash(self) -> str:
-        digest = hashlib.sha256()
-        digest.update(self.policy_path.read_bytes())
-        return digest.hexdigest()
+        return self._snapshot()[3]
 
     def show(self) -> str:
         """Return the policy file as a YAML string."""
 
+        cache = self._fresh_cache(self.policy_path.stat())
+        if cache is not None:
+            return cache[2].decode("utf-8")
         return self.policy_path.read_text(encoding="utf-8")
 
     def approve(
@@ -80,13 +135,39 @@ class PolicyManager:
         domain: str,
         scope: str,
     ) -> PolicyApproval:
-        policy = self._read_policy()
-        rule = self._coerce_rule(domain=domain, scope=scope)
-        created = policy.add_domain_rule(domain=rule.domain, scope=rule.scope)
-        if created:
+        return self.approve_many([(domain, scope)])[0]
+
+    def approve_many(self, entries: Iterable[tuple[str, str]]) -> list[PolicyApproval]:
+        """Approve several ``(domain, scope)`` pairs with a single policy write.
+
+        Every entry is validated before anything is written; the ledger
+        receives one signed line per newly created rule.
+        """
+
+        current = self._current_policy()
+        rules = [
+            self._coerce_rule(domain=domain, scope=scope) for domain, scope in entries
+        ]
+        policy: Policy | None = None
+        approvals: list[PolicyApproval] = []
+        for rule in rules:
+            created = False
+            if policy is not None:
+                created = policy.add_domain_rule(domain=rule.domain, scope=rule.scope)
+            elif not current.has_domain_rule(domain=rule.domain, scope=rule.scope):
+                # Only copy the cached policy once something actually changes.
+                policy = current.model_copy(deep=True)
+                created = policy.add_domain_rule(domain=rule.domain, scope=rule.scope)
+            approvals.append(
+                PolicyApproval(domain=rule.domain, scope=rule.scope, created=created)
+            )
+        if policy is not None:
             self._write_policy(policy)
-            self._record("approve", domain=rule.domain, scope=rule.scope)
-        return PolicyApproval(domain=rule.domain, scope=rule.scope, created=created)
+            self._record_many(
+                "approve",
+                [(item.domain, item.scope) for item in approvals if item.created],
+            )
+        return approvals
 
     def revoke(self, domain: str, scope: str | None = None) -> None:
         policy = self._read_policy()
@@ -103,17 +184,31 @@ class PolicyManager:
         self._record("revoke", domain=domain_norm, scope=scope_norm or "*")
 
     def _record(self, action: str, *, domain: str, scope: str) -> None:
-        try:
-            ledger = ConsentLedger(self.ledger_path)
-        except LedgerError as exc:  # pragma: no cover - defensive
-            raise PolicyError(str(exc)) from exc
-        ledger.record(
-            action=action,
-            domain=domain,
-            scope=scope,
-            policy_hash=self._policy_hash(),
+        self._record_many(action, [(domain, scope)])
+
+    def _record_many(self, action: str, entries: list[tuple[str, str]]) -> None:
+        if self._ledger is None:
+            try:
+                self._ledger = ConsentLedger(self.ledger_path)
+            except LedgerError as exc:  # pragma: no cover - defensive
+                raise PolicyError(str(exc)) from exc
+        self._ledger.record_many(
+            action=action, entries=entries, policy_hash=self._policy_hash()
         )
 
+    def close(self) -> None:
+        """Release the consent ledger handle held by this manager."""
+
+        if self._ledger is not None:
+            self._ledger.close()
+            self._ledger = None
+
+    def __enter__(self) -> "PolicyManager":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     @staticmethod
     def _coerce_rule(*, domain: str, scope: str) -> DomainPolicyRule:
         try:
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime, time
 from pathlib import Path
 from typing import Any, Iterable
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 
 _DAY_ORDER: tuple[str, ...] = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_DAY_INDEX: dict[str, int] = {day: index for index, day in enumerate(_DAY_ORDER)}
 _DAY_ALIASES: dict[str, str] = {
     "monday": "mon",
     "tuesday": "tue",
@@ -32,8 +41,6 @@ _DAY_ALIASES: dict[str, str] = {
 
 def _normalise_day(value: str) -> str:
     key = value.strip().lower()
-    if key in {"mon-sun", "mon-sun."}:
-        return "mon-sun"
     alias = _DAY_ALIASES.get(key)
     if alias:
         return alias
@@ -42,16 +49,26 @@ def _normalise_day(value: str) -> str:
     return _DAY_ALIASES[key]
 
 
-def _expand_range(start: str, end: str) -> list[str]:
+# Every valid ascending range (bit 0 = Monday), so parsing one is a single
+# dict lookup.
+_RANGE_MASKS: dict[tuple[str, str], int] = {
+    (start, end): (1 << (end_index + 1)) - (1 << start_index)
+    for start_index, start in enumerate(_DAY_ORDER)
+    for end_index, end in enumerate(_DAY_ORDER[start_index:], start_index)
+}
+
+
+def _range_mask(start: str, end: str) -> int:
+    """Return the weekday bitmask covering ``start``-``end``."""
+
     start_key = _DAY_ALIASES.get(start.strip().lower(), start.strip().lower())
     end_key = _DAY_ALIASES.get(end.strip().lower(), end.strip().lower())
-    if start_key not in _DAY_ORDER or end_key not in _DAY_ORDER:
+    mask = _RANGE_MASKS.get((start_key, end_key))
+    if mask is not None:
+        return mask
+    if start_key not in _DAY_INDEX or end_key not in _DAY_INDEX:
         raise ValueError(f"invalid day range: {start!r}-{end!r}")
-    start_index = _DAY_ORDER.index(start_key)
-    end_index = _DAY_ORDER.index(end_key)
-    if start_index > end_index:
-        raise ValueError("day ranges must be ascending")
-    return list(_DAY_ORDER[start_index : end_index + 1])
+    raise ValueError("day ranges must be ascending")
 
 
 def _format_time(value: time) -> str:
@@ -64,7 +81,8 @@ def _normalise_domain(value: str) -> str:
         parsed = urlparse(text)
         if parsed.hostname:
             text = parsed.hostname.lower()
-    return text.strip().strip("/")
+    # Interned so the many rule/allowlist comparisons hit the identity check.
+    return sys.intern(text.strip().strip("/"))
 
 
 class NetworkWindow(BaseModel):
@@ -83,28 +101,21 @@ class NetworkWindow(BaseModel):
             raw_values = [value]
         else:
             raw_values = list(value)
-        expanded: list[str] = []
+        # Days are accumulated as a 7-bit mask: duplicates collapse for free and
+        # the result comes out in calendar order without sorting.
+        mask = 0
         for item in raw_values:
             text = str(item).strip()
             if not text:
                 continue
             if "-" in text and text.count("-") == 1 and len(text) >= 3:
                 start, end = text.split("-", 1)
-                expanded.extend(_expand_range(start, end))
+                mask |= _range_mask(start, end)
                 continue
-            if text.lower() == "mon-sun":
-                expanded.extend(_DAY_ORDER)
-                continue
-            expanded.append(text)
-        normalised = []
-        for item in expanded:
-            if item.lower() == "mon-sun":
-                normalised.extend(_DAY_ORDER)
-            else:
-                normalised.append(_normalise_day(item))
-        if not normalised:
+            mask |= 1 << _DAY_INDEX[_normalise_day(text)]
+        if not mask:
             raise ValueError("at least one day must be provided")
-        return sorted(set(normalised), key=_DAY_ORDER.index)
+        return [day for index, day in enumerate(_DAY_ORDER) if mask >> index & 1]
 
     @field_validator("start", "end", mode="before")
     @classmethod
@@ -127,12 +138,12 @@ class NetworkWindow(BaseModel):
         end_minutes = self.end.hour * 60 + self.end.minute
         return end_minutes - start_minutes
 
+    @field_serializer("start", "end", when_used="json")
+    def _serialise_time(self, value: time) -> str:
+        return _format_time(value)
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "days": list(self.days),
-            "start": _format_time(self.start),
-            "end": _format_time(self.end),
-        }
+        return self.model_dump(mode="json")
 
 
 class Budgets(BaseModel):
@@ -152,10 +163,12 @@ class Subject(BaseModel):
     hostname: str
     generated_at: datetime
 
+    @field_serializer("generated_at", when_used="json")
+    def _serialise_generated_at(self, value: datetime) -> str:
+        return value.isoformat()
+
     def to_dict(self) -> dict[str, Any]:
-        payload = self.model_dump(mode="python")
-        payload["generated_at"] = payload["generated_at"].isoformat()
-        return payload
+        return self.model_dump(mode="json")
 
 
 class ModelEntry(BaseModel):
@@ -176,16 +189,13 @@ class ModelsSection(BaseModel):
     embedding: ModelEntry
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "llm": self.llm.to_dict(),
-            "embedding": self.embedding.to_dict(),
-        }
+        return self.model_dump(mode="json")
 
 
 class DomainPolicyRule(BaseModel):
     """Persisted policy entry describing an approved domain and its scope."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     domain: str
     scope: str = "web"
@@ -209,7 +219,7 @@ class DomainPolicyRule(BaseModel):
         return text
 
     def to_dict(self) -> dict[str, str]:
-        return {"domain": self.domain, "scope": self.scope}
+        return self.model_dump(mode="json")
 
 
 @dataclass(slots=True)
@@ -239,8 +249,9 @@ class Policy(BaseModel):
         default_factory=list,
         alias="domain_rules",
     )
-    subject: Subject | None = None
     models: ModelsSection
+    # Declared last so it is serialised after ``models``, as in policy.yaml.
+    subject: Subject | None = None
 
     @field_validator("allowlist_domains", mode="before")
     @classmethod
@@ -275,21 +286,9 @@ class Policy(BaseModel):
         return self
 
     def to_dict(self) -> dict[str, Any]:
-        payload = {
-            "version": self.version,
-            "autostart": self.autostart,
-            "offline_default": self.offline_default,
-            "require_corroboration": self.require_corroboration,
-            "kill_switch_file": self.kill_switch_file,
-            "network_windows": [window.to_dict() for window in self.network_windows],
-            "budgets": self.budgets.to_dict(),
-            "allowlist_domains": list(self.allowlist_domains),
-            "domain_rules": [rule.to_dict() for rule in self.domain_rule_entries],
-            "models": self.models.to_dict(),
-        }
-        if self.subject is not None:
-            payload["subject"] = self.subject.to_dict()
-        return payload
+        # One serialisation pass over the whole tree; field order, aliases and
+        # the custom time/datetime serialisers reproduce the policy.yaml layout.
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
 
     def kill_switch_path(self, *, home: Path | None = None) -> Path:
         raw = Path(self.kill_switch_file).expanduser()
@@ -314,11 +313,15 @@ class Policy(BaseModel):
             for rule in self.domain_rule_entries
         ]
 
+    def has_domain_rule(self, *, domain: str, scope: str) -> bool:
+        return any(
+            rule.domain == domain and rule.scope == scope
+            for rule in self.domain_rule_entries
+        )
+
     def add_domain_rule(self, *, domain: str, scope: str) -> bool:
         candidate = DomainPolicyRule(domain=domain, scope=scope)
-        key = (candidate.domain, candidate.scope)
-        existing = {(rule.domain, rule.scope) for rule in self.domain_rule_entries}
-        if key in existing:
+        if self.has_domain_rule(domain=candidate.domain, scope=candidate.scope):
             return False
         self.domain_rule_entries.append(candidate)
         self._sync_domain_rules()
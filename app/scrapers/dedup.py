@@ -0,0 +1,101 @@
+"""Near-duplicate detection for scraped documents."""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Iterator
+
+try:  # pragma: no cover - optional dependency
+    from datasketch import MinHash, MinHashLSH  # type: ignore
+except Exception:  # pragma: no cover - fallback when unavailable
+    MinHash = None
+    MinHashLSH = None
+
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_NUM_PERM = 64
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_CAPACITY = 10_000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> Iterator[bytes]:
+    """Yield the word ``size``-grams of *text* as UTF-8 encoded shingles."""
+
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) <= size:
+        if tokens:
+            yield " ".join(tokens).encode("utf-8")
+        return
+    for index in range(len(tokens) - size + 1):
+        yield " ".join(tokens[index : index + size]).encode("utf-8")
+
+
+class ContentDedupTracker:
+    """Flag documents whose content nearly matches an already seen one.
+
+    Signatures are indexed in a MinHash LSH so each lookup is a constant number
+    of bucket probes instead of a comparison against every stored document.
+    When :mod:`datasketch` is unavailable the tracker is disabled and callers
+    keep relying on exact content hashes. At most *capacity* documents are
+    indexed; the least recently checked one is evicted to make room.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.capacity = max(1, capacity)
+        self._lsh = (
+            MinHashLSH(threshold=threshold, num_perm=num_perm)
+            if MinHashLSH is not None
+            else None
+        )
+        self._duplicates: set[str] = set()
+        # Indexed keys, least recently checked first.
+        self._keys: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._lsh is not None
+
+    def check(self, key: str, content: str) -> bool:
+        """Index *content* under *key* and report whether it is a near-duplicate."""
+
+        if self._lsh is None:
+            return False
+        grams = list(shingles(content, self.shingle_size))
+        if not grams:
+            return False
+        signature = MinHash(num_perm=self.num_perm)
+        signature.update_batch(grams)
+        if key in self._keys:
+            self._lsh.remove(key)
+            del self._keys[key]
+        duplicate = any(match != key for match in self._lsh.query(signature))
+        self._lsh.insert(key, signature)
+        self._keys[key] = None
+        while len(self._keys) > self.capacity:
+            evicted, _ = self._keys.popitem(last=False)
+            self._lsh.remove(evicted)
+            self._duplicates.discard(evicted)
+        if duplicate:
+            self._duplicates.add(key)
+        else:
+            self._duplicates.discard(key)
+        return duplicate
+
+    def is_duplicate(self, key: str) -> bool:
+        """Return the verdict of the last :meth:`check` for *key*."""
+
+        return key in self._duplicates
+
+
+__all__ = ["ContentDedupTracker", "shingles"]
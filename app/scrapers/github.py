@@ -12,6 +12,11 @@ from urllib.parse import urlparse
 
 from .http import HTTPScraper
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 _STANDARD_CHANGELOG_PATHS: tuple[str, ...] = (
     "CHANGELOG.md",
     "CHANGES.md",
@@ -58,7 +63,7 @@ class RepositorySpec:
         return f"{self.owner}/{self.name}"
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RepositoryInfo:
     """Summary of a GitHub repository."""
 
@@ -268,8 +273,9 @@ class GitHubScraper:
             return None
         raw, headers = payload
         try:
-            data = json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
+            # Both parsers take the raw bytes directly, skipping a str copy.
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
             return None
         if not isinstance(data, dict):
             return None
@@ -308,7 +314,9 @@ class GitHubScraper:
         return RepositorySpec(owner=owner, name=name, explicit_paths=explicit_paths)
 
     def _parse_repository(self, repo: str) -> tuple[Optional[str], Optional[str]]:
-        if "/" not in repo or repo.endswith("/"):
+        # Plain ``owner/name`` strings are split directly; only real URLs go
+        # through ``urlparse``.
+        if "://" in repo or repo.startswith("//"):
             parsed = urlparse(repo)
             if not parsed.netloc:
                 return None, None
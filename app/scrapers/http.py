@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import hashlib
 import logging
 import re
-from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from email.message import Message
+from functools import lru_cache
+from html import unescape
+from types import MappingProxyType
 from typing import Callable, Dict, Iterable, Mapping, MutableMapping, Optional
 from urllib import request as urllib_request
 from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 import time
 
+from .dedup import ContentDedupTracker
+
+try:  # pragma: no cover - optional dependency
+    import httpx
+except Exception:  # pragma: no cover - fallback when unavailable
+    httpx = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover - fallback when unavailable
+    xxhash = None
+
 try:  # pragma: no cover - optional dependency
     import trafilatura  # type: ignore
 except Exception:  # pragma: no cover - fallback when unavailable
@@ -24,11 +43,35 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - fallback when unavailable
     Document = None
 
+try:  # pragma: no cover - optional dependency
+    # The Modest backend (``selectolax.parser``) was dropped in selectolax 1.0.
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except Exception:  # pragma: no cover - fallback when unavailable
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_USER_AGENT = "WatcherScraper/1.0"
 DEFAULT_TIMEOUT = 10
 DEFAULT_THROTTLE = 1.0
+DEFAULT_ROBOTS_TTL = 3600.0
+_READ_BLOCK = 64 * 1024
+DEFAULT_MAX_PARALLEL = 8
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+_ROBOTS_PREFETCH_WORKERS = 8
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_INVISIBLE_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """Memoised :func:`urlparse`; a fetch parses the same URL several times."""
+
+    return urlparse(url)
 
 
 class CaseInsensitiveDict(MutableMapping[str, str]):
@@ -61,6 +104,11 @@ class CaseInsensitiveDict(MutableMapping[str, str]):
     def items(self):  # pragma: no cover - forwarding helper
         return self._store.items()
 
+    def view(self) -> Mapping[str, str]:
+        """Return a read-only view of the (lower-cased) headers without copying."""
+
+        return MappingProxyType(self._store)
+
     def copy(self) -> "CaseInsensitiveDict":  # pragma: no cover - helper
         return CaseInsensitiveDict(self._store)
 
@@ -93,6 +141,7 @@ class CachedResponse:
     content_hash: Optional[str] = None
     license: Optional[str] = None
     is_duplicate: bool = False
+    raw_hash: Optional[str] = None
 
     def to_result(self) -> ScrapeResult:
         return ScrapeResult(
@@ -101,7 +150,7 @@ class CachedResponse:
             raw_content=self.raw_content,
             content_hash=self.content_hash,
             license=self.license,
-            headers=dict(self.headers.items()),
+            headers=self.headers.view(),
             etag=self.etag,
             last_modified=self.last_modified,
             is_duplicate=self.is_duplicate,
@@ -117,39 +166,144 @@ class HTTPScraper:
         user_agent: str = DEFAULT_USER_AGENT,
         timeout: int = DEFAULT_TIMEOUT,
         throttle_delay: float = DEFAULT_THROTTLE,
+        robots_ttl: float = DEFAULT_ROBOTS_TTL,
         opener: Optional[Callable[..., object]] = None,
+        client: "httpx.Client | None" = None,
+        async_client: "httpx.AsyncClient | None" = None,
+        dedup: ContentDedupTracker | None = None,
+        extractors: Iterable[Extractor] | None = None,
+        fast_mode: bool = False,
+        min_chars: int = 1,
         time_func: Callable[[], float] | None = None,
         sleep_func: Callable[[float], None] | None = None,
     ) -> None:
         self.user_agent = user_agent
         self.timeout = timeout
         self.throttle_delay = max(0.0, throttle_delay)
+        self.robots_ttl = robots_ttl
+        # Extractors run in order and the first result of at least min_chars
+        # characters wins, so the costlier readability pass only runs when
+        # trafilatura came back empty.
+        if extractors is None:
+            extractors = FAST_EXTRACTORS if fast_mode else DEFAULT_EXTRACTORS
+        self._extractors: tuple[Extractor, ...] = tuple(extractors)
+        self.min_chars = max(1, min_chars)
         self._opener = opener or urllib_request.urlopen
+        # Without an explicit opener, requests go through a pooled httpx client
+        # so consecutive fetches to the same host reuse their keep-alive
+        # connection instead of paying a new TCP/TLS handshake every time.
+        self._owns_client = client is None and opener is None and httpx is not None
+        if self._owns_client:
+            client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self._client = client
+        # Created on the first afetch() so synchronous users never pay for it,
+        # and only next to the default client: an injected client's transport
+        # and settings are never bypassed by a default asynchronous one.
+        self._async_client = async_client
         self._time = time_func or time.monotonic
         self._sleep = sleep_func or time.sleep
-        self._robots: Dict[str, RobotFileParser] = {}
+        # netloc -> (parsed robots.txt, monotonic time it was fetched)
+        self._robots: Dict[str, tuple[RobotFileParser, float]] = {}
         self._cache: Dict[str, CachedResponse] = {}
         self._url_hash: Dict[str, str] = {}
-        self._hash_urls: Dict[str, set[str]] = defaultdict(set)
+        # Lists rather than sets: nearly every digest maps to a single URL and
+        # a one-element list is a fraction of an empty set's footprint.
+        self._hash_urls: Dict[str, list[str]] = {}
+        self._dedup = dedup if dedup is not None else ContentDedupTracker()
         self._last_request: Dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        # Guards the response cache, the hash index and the near-duplicate
+        # tracker, which fetch_many() may update from several worker threads.
+        self._state_lock = threading.RLock()
+
+    def close(self) -> None:
+        """Release the pooled connections held by the synchronous client.
+
+        An asynchronous client cannot be closed from synchronous code: after
+        using :meth:`afetch` or :meth:`fetch_many`, call :meth:`aclose` (or use
+        the scraper as an ``async with`` context manager) instead.
+        """
+
+        if self._client is not None:
+            self._client.close()
+
+    async def aclose(self) -> None:
+        """Release the pooled connections of both clients."""
+
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def __enter__(self) -> "HTTPScraper":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HTTPScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def fetch(self, url: str, *, respect_robots: bool = True) -> Optional[ScrapeResult]:
         """Fetch *url* and return a :class:`ScrapeResult` when successful."""
 
         cached = self._get_cached(url)
-
         response = self._perform_request(url, respect_robots=respect_robots)
-        if response is None:
+        return self._build_result(url, cached, response)
+
+    async def afetch(
+        self, url: str, *, respect_robots: bool = True
+    ) -> Optional[ScrapeResult]:
+        """Asynchronous :meth:`fetch` sharing the robots, throttle and caches.
+
+        Requests go through a pooled ``httpx.AsyncClient``; with a custom
+        ``opener`` or ``client`` and no ``async_client`` (or without httpx)
+        the blocking :meth:`fetch` runs in a worker thread instead.
+        """
+
+        client = self._async_http()
+        if client is None:
+            return await asyncio.to_thread(
+                self.fetch, url, respect_robots=respect_robots
+            )
+        if respect_robots and not await asyncio.to_thread(self._is_allowed, url):
+            logger.info("blocked by robots.txt: %s", url)
+            cached = self._get_cached(url)
             return cached.to_result() if cached else None
 
-        if response.content is None:
-            decoded = self._decode_content(response.raw_content, response.headers)
-            response.content = self._extract_content(decoded)
-            response.content_hash = self._store_hash(url, response.content)
-            response.is_duplicate = self._hash_is_duplicate(response.content_hash)
-            response.license = detect_license(response.headers, response.content)
+        cached = self._get_cached(url)
+        await self._athrottle(_parse_url(url).netloc)
+        try:
+            sent = await self._asend(client, url, self._request_headers(cached))
+        except (HTTPError, URLError) as error:
+            response = self._request_failed(url, cached, error)
+        else:
+            response = self._remember(url, sent)
+        return self._build_result(url, cached, response)
+
+    async def fetch_many(
+        self,
+        urls: Iterable[str],
+        *,
+        respect_robots: bool = True,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ) -> list[Optional[ScrapeResult]]:
+        """Fetch *urls* concurrently, at most *max_parallel* at a time.
 
-        return response.to_result()
+        Results are returned in the order of *urls*; per-domain throttling
+        still applies, so only requests to different hosts overlap.
+        """
+
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+        async def _bounded(url: str) -> Optional[ScrapeResult]:
+            async with semaphore:
+                return await self.afetch(url, respect_robots=respect_robots)
+
+        return list(await asyncio.gather(*(_bounded(url) for url in urls)))
 
     def fetch_raw(
         self, url: str, *, respect_robots: bool = True
@@ -159,7 +313,43 @@ class HTTPScraper:
         response = self._perform_request(url, respect_robots=respect_robots)
         if response is None:
             return None
-        return response.raw_content, dict(response.headers.items())
+        return response.raw_content, response.headers.view()
+
+    def _build_result(
+        self,
+        url: str,
+        cached: Optional[CachedResponse],
+        response: Optional[CachedResponse],
+    ) -> Optional[ScrapeResult]:
+        if response is None:
+            return cached.to_result() if cached else None
+
+        if response.content is None:
+            decoded = self._decode_content(response.raw_content, response.headers)
+            if self._looks_like_html(response.raw_content, response.headers):
+                response.content = self._extract_content(decoded)
+            else:
+                # JSON, XML, plain text...: nothing for the extractors to find.
+                response.content = decoded
+            if response.content is decoded and self._is_verbatim_utf8(
+                response.headers, decoded
+            ):
+                # Nothing was extracted or replaced: the payload already is the
+                # UTF-8 form of the content, so hash it without re-encoding.
+                # The digest of the payload was already taken while reading.
+                payload, digest = response.raw_content, response.raw_hash
+            else:
+                payload = response.content.encode("utf-8")
+                digest = _content_digest(payload)
+            with self._state_lock:
+                response.content_hash = self._store_hash(url, payload, digest=digest)
+                response.is_duplicate = self._dedup.check(url, response.content)
+                response.is_duplicate |= self._hash_is_duplicate(
+                    response.content_hash
+                )
+            response.license = detect_license(response.headers, response.content)
+
+        return response.to_result()
 
     def _perform_request(self, url: str, *, respect_robots: bool) -> Optional[CachedResponse]:
         if respect_robots and not self._is_allowed(url):
@@ -167,58 +357,148 @@ class HTTPScraper:
             return None
 
         cached = self._get_cached(url)
+        self._throttle(_parse_url(url).netloc)
+        try:
+            sent = self._send(url, self._request_headers(cached))
+        except (HTTPError, URLError) as error:
+            return self._request_failed(url, cached, error)
+        return self._remember(url, sent)
 
-        domain = urlparse(url).netloc
-        self._throttle(domain)
-
+    def _request_headers(self, cached: Optional[CachedResponse]) -> Dict[str, str]:
         headers = {"User-Agent": self.user_agent}
         if cached:
             if cached.etag:
                 headers["If-None-Match"] = cached.etag
             if cached.last_modified:
                 headers["If-Modified-Since"] = cached.last_modified
+        return headers
 
-        request = urllib_request.Request(url, headers=headers)
-
-        try:
-            with self._opener(request, timeout=self.timeout) as response:  # type: ignore[arg-type]
-                raw = response.read()
-                header_map = CaseInsensitiveDict(dict(response.headers.items()))
-                etag = header_map.get("etag")
-                last_modified = header_map.get("last-modified")
-        except HTTPError as error:
+    def _request_failed(
+        self, url: str, cached: Optional[CachedResponse], error: URLError
+    ) -> Optional[CachedResponse]:
+        if isinstance(error, HTTPError):
             if error.code == 304 and cached:
                 logger.debug("not modified: %s", url)
                 return cached
             logger.warning("failed to fetch %s: %s", url, error)
             return None
-        except URLError as error:
-            logger.warning("failed to fetch %s: %s", url, error.reason)
-            return None
+        logger.warning("failed to fetch %s: %s", url, error.reason)
+        return None
 
+    def _remember(
+        self, url: str, sent: tuple[bytes, CaseInsensitiveDict, str]
+    ) -> CachedResponse:
+        raw, header_map, raw_hash = sent
         response_cache = CachedResponse(
             url=url,
             raw_content=raw,
+            raw_hash=raw_hash,
             headers=header_map,
-            etag=etag,
-            last_modified=last_modified,
+            etag=header_map.get("etag"),
+            last_modified=header_map.get("last-modified"),
         )
-        self._cache[url] = response_cache
+        with self._state_lock:
+            self._cache[url] = response_cache
         return response_cache
 
+    def _send(
+        self, url: str, headers: Mapping[str, str]
+    ) -> tuple[bytes, CaseInsensitiveDict, str]:
+        """Issue a GET request, raising ``HTTPError``/``URLError`` like urlopen.
+
+        Returns the body, its headers and the digest of the body, which is
+        computed block by block while the body is read.
+        """
+
+        if self._client is None:
+            request = urllib_request.Request(url, headers=dict(headers))
+            with self._opener(request, timeout=self.timeout) as response:  # type: ignore[arg-type]
+                blocks = iter(lambda: response.read(_READ_BLOCK), b"")
+                raw, digest = _read_blocks(blocks)
+                return raw, CaseInsensitiveDict(dict(response.headers.items())), digest
+        try:
+            with self._client.stream("GET", url, headers=headers) as response:
+                if response.status_code >= 300:
+                    raise _http_error(url, response)
+                raw, digest = _read_blocks(response.iter_bytes(_READ_BLOCK))
+                header_map = CaseInsensitiveDict(dict(response.headers.items()))
+        except httpx.HTTPError as error:
+            raise URLError(error) from error
+        return raw, header_map, digest
+
+    def _async_http(self) -> "httpx.AsyncClient | None":
+        if self._async_client is None and self._owns_client:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._async_client
+
+    async def _asend(
+        self, client: "httpx.AsyncClient", url: str, headers: Mapping[str, str]
+    ) -> tuple[bytes, CaseInsensitiveDict, str]:
+        """Asynchronous counterpart of :meth:`_send` on the pooled client."""
+
+        reader = _BlockReader()
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code >= 300:
+                    raise _http_error(url, response)
+                async for block in response.aiter_bytes(_READ_BLOCK):
+                    reader.feed(block)
+                header_map = CaseInsensitiveDict(dict(response.headers.items()))
+        except httpx.HTTPError as error:
+            raise URLError(error) from error
+        raw, digest = reader.result()
+        return raw, header_map, digest
+
     def _get_cached(self, url: str) -> Optional[CachedResponse]:
-        cached = self._cache.get(url)
-        if cached and cached.content_hash:
-            cached.is_duplicate = self._hash_is_duplicate(cached.content_hash)
+        with self._state_lock:
+            cached = self._cache.get(url)
+            if cached and cached.content_hash:
+                cached.is_duplicate = self._hash_is_duplicate(
+                    cached.content_hash
+                ) or self._dedup.is_duplicate(url)
         return cached
 
+    def prefetch_robots(self, urls: Iterable[str]) -> None:
+        """Fetch the robots.txt of every host in *urls* concurrently.
+
+        Hosts whose rules are already cached and fresh are skipped.
+        """
+
+        targets: Dict[str, str] = {}
+        for url in urls:
+            parsed = _parse_url(url)
+            if parsed.netloc and self._cached_robots(parsed.netloc) is None:
+                targets.setdefault(parsed.netloc, parsed.scheme or "https")
+        if not targets:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(_ROBOTS_PREFETCH_WORKERS, len(targets)),
+            thread_name_prefix="robots",
+        ) as pool:
+            parsers = pool.map(self._fetch_robots, targets.values(), targets)
+            for netloc, parser in zip(targets, parsers):
+                self._robots[netloc] = (parser, self._time())
+
+    def _cached_robots(self, netloc: str) -> Optional[RobotFileParser]:
+        entry = self._robots.get(netloc)
+        if entry is None:
+            return None
+        parser, fetched_at = entry
+        if self._time() - fetched_at > self.robots_ttl:
+            return None
+        return parser
+
     def _is_allowed(self, url: str) -> bool:
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         key = parsed.netloc
-        parser = self._robots.get(key)
+        parser = self._cached_robots(key)
         if parser is None:
             parser = self._fetch_robots(parsed.scheme, parsed.netloc)
-            self._robots[key] = parser
+            self._robots[key] = (parser, self._time())
         try:
             return parser.can_fetch(self.user_agent, url)
         except Exception:  # pragma: no cover - defensive
@@ -227,10 +507,9 @@ class HTTPScraper:
     def _fetch_robots(self, scheme: str, netloc: str) -> RobotFileParser:
         robots_url = urljoin(f"{scheme}://{netloc}", "robots.txt")
         parser = RobotFileParser()
-        request = urllib_request.Request(robots_url, headers={"User-Agent": self.user_agent})
         try:
-            with self._opener(request, timeout=self.timeout) as response:  # type: ignore[arg-type]
-                body = response.read().decode("utf-8", errors="ignore")
+            raw, _, _ = self._send(robots_url, {"User-Agent": self.user_agent})
+            body = raw.decode("utf-8", errors="ignore")
         except Exception:
             parser.parse([])
             return parser
@@ -238,57 +517,81 @@ class HTTPScraper:
         return parser
 
     def _throttle(self, domain: str) -> None:
+        wait_for = self._reserve_slot(domain)
+        if wait_for > 0:
+            self._sleep(wait_for)
+
+    async def _athrottle(self, domain: str) -> None:
+        wait_for = self._reserve_slot(domain)
+        if wait_for > 0:
+            await asyncio.sleep(wait_for)
+
+    def _reserve_slot(self, domain: str) -> float:
+        """Book the next request slot for *domain* and return the wait before it."""
+
         if self.throttle_delay <= 0:
-            return
-        now = self._time()
-        last = self._last_request.get(domain)
-        if last is not None:
-            wait_for = self.throttle_delay - (now - last)
-            if wait_for > 0:
-                self._sleep(wait_for)
-                now = self._time()
-        self._last_request[domain] = now
+            return 0.0
+        with self._throttle_lock:
+            now = self._time()
+            last = self._last_request.get(domain)
+            wait_for = 0.0 if last is None else self.throttle_delay - (now - last)
+            # Reserve the slot before sleeping so concurrent fetches to the same
+            # domain queue up behind each other instead of firing together.
+            self._last_request[domain] = now + max(wait_for, 0.0)
+        return max(wait_for, 0.0)
+
+    def _declared_charset(self, headers: Mapping[str, str]) -> str:
+        content_type = headers.get("content-type", "")
+        match = _CHARSET_RE.search(content_type)
+        return match.group(1) if match else "utf-8"
+
+    def _is_verbatim_utf8(self, headers: Mapping[str, str], text: str) -> bool:
+        try:
+            utf8 = codecs.lookup(self._declared_charset(headers)).name == "utf-8"
+        except LookupError:
+            return False
+        # A replacement character may come from an undecodable byte.
+        return utf8 and "\ufffd" not in text
 
     def _decode_content(self, raw: bytes, headers: Mapping[str, str]) -> str:
-        content_type = headers.get("content-type", "")
-        match = re.search(r"charset=([\\w-]+)", content_type)
-        encoding = match.group(1) if match else "utf-8"
+        encoding = self._declared_charset(headers)
         try:
             return raw.decode(encoding, errors="replace")
         except LookupError:  # pragma: no cover - rare codec issue
             return raw.decode("utf-8", errors="replace")
 
+    @staticmethod
+    def _looks_like_html(raw: bytes, headers: Mapping[str, str]) -> bool:
+        if b"<" not in raw:
+            return False
+        content_type = (headers.get("content-type") or "").lstrip().lower()
+        return not content_type or content_type.startswith(_HTML_CONTENT_TYPES)
+
     def _extract_content(self, text: str) -> str:
-        if trafilatura is not None:
-            try:
-                extracted = trafilatura.extract(text)
-                if extracted:
-                    return extracted.strip()
-            except Exception:  # pragma: no cover - library failure
-                logger.debug("trafilatura failed to extract content", exc_info=True)
-        if Document is not None:
-            try:
-                document = Document(text)
-                summary = document.summary()
-                if summary:
-                    return self._strip_tags(summary)
-            except Exception:  # pragma: no cover - library failure
-                logger.debug("Readability failed to extract content", exc_info=True)
+        for extractor in self._extractors:
+            extracted = extractor(text)
+            if extracted and len(extracted) >= self.min_chars:
+                return extracted
         return text
 
     def _strip_tags(self, html: str) -> str:
-        return re.sub(r"<[^>]+>", " ", html).strip()
+        return strip_tags(html)
 
-    def _store_hash(self, url: str, content: str) -> str:
-        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def _store_hash(
+        self, url: str, content: bytes, *, digest: Optional[str] = None
+    ) -> str:
+        if digest is None:
+            digest = _content_digest(content)
         previous = self._url_hash.get(url)
-        if previous and previous in self._hash_urls:
+        if previous == digest:
+            return digest
+        if previous is not None:
             urls = self._hash_urls[previous]
-            urls.discard(url)
+            urls.remove(url)
             if not urls:
                 del self._hash_urls[previous]
         self._url_hash[url] = digest
-        self._hash_urls[digest].add(url)
+        self._hash_urls.setdefault(digest, []).append(url)
         return digest
 
     def _hash_is_duplicate(self, digest: Optional[str]) -> bool:
@@ -298,6 +601,117 @@ class HTTPScraper:
         return bool(urls and len(urls) > 1)
 
 
+Extractor = Callable[[str], Optional[str]]
+
+
+def strip_tags(html: str) -> str:
+    """Return the visible text of *html*."""
+
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        tree.strip_tags(["script", "style", "noscript"])
+        node = tree.body or tree.root
+        if node is not None:
+            return node.text(separator=" ", strip=True)
+    text = _TAG_RE.sub(" ", _INVISIBLE_RE.sub(" ", html))
+    return unescape(text).strip()
+
+
+def extract_with_trafilatura(html: str) -> Optional[str]:
+    """Extract the main text of *html* with trafilatura, when installed."""
+
+    if trafilatura is None:
+        return None
+    try:
+        extracted = trafilatura.extract(html)
+    except Exception:  # pragma: no cover - library failure
+        logger.debug("trafilatura failed to extract content", exc_info=True)
+        return None
+    return extracted.strip() if extracted else None
+
+
+def extract_with_readability(html: str) -> Optional[str]:
+    """Extract the main text of *html* with readability, when installed."""
+
+    if Document is None:
+        return None
+    try:
+        summary = Document(html).summary()
+    except Exception:  # pragma: no cover - library failure
+        logger.debug("Readability failed to extract content", exc_info=True)
+        return None
+    return strip_tags(summary) if summary else None
+
+
+DEFAULT_EXTRACTORS: tuple[Extractor, ...] = (
+    extract_with_trafilatura,
+    extract_with_readability,
+)
+FAST_EXTRACTORS: tuple[Extractor, ...] = (extract_with_trafilatura,)
+
+
+def _http_error(url: str, response: "httpx.Response") -> HTTPError:
+    """Return the ``HTTPError`` urlopen would raise for *response*."""
+
+    headers = Message()
+    for name, value in response.headers.items():
+        headers[name] = value
+    return HTTPError(url, response.status_code, response.reason_phrase, headers, None)
+
+
+def _content_hasher():
+    """Return a fresh hasher for the digests used to detect duplicates.
+
+    The hash only serves deduplication, so the much cheaper non-cryptographic
+    ``xxh3_64`` is preferred when :mod:`xxhash` is installed.
+    """
+
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.sha256()
+
+
+def _content_digest(data: bytes) -> str:
+    hasher = _content_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class _BlockReader:
+    """Accumulate a payload, hashing each block as it arrives."""
+
+    def __init__(self) -> None:
+        self._hasher = _content_hasher()
+        self._chunks: list[bytes] = []
+
+    def feed(self, block: bytes) -> None:
+        self._hasher.update(block)
+        self._chunks.append(block)
+
+    def result(self) -> tuple[bytes, str]:
+        return b"".join(self._chunks), self._hasher.hexdigest()
+
+
+def _read_blocks(blocks: Iterable[bytes]) -> tuple[bytes, str]:
+    """Join *blocks* into one payload, hashing each block as it arrives."""
+
+    reader = _BlockReader()
+    for block in blocks:
+        reader.feed(block)
+    return reader.result()
+
+
+_LICENSE_PATTERNS = {
+    "mit license": "MIT License",
+    "apache license": "Apache License",
+    "creative commons": "Creative Commons",
+    "gpl": "GNU General Public License",
+}
+_LICENSE_RE = re.compile(
+    "|".join(re.escape(needle) for needle in _LICENSE_PATTERNS), re.IGNORECASE
+)
+
+
 def detect_license(headers: Mapping[str, str], content: str) -> Optional[str]:
     """Attempt to infer a license from headers or page content."""
 
@@ -307,17 +721,23 @@ def detect_license(headers: Mapping[str, str], content: str) -> Optional[str]:
         if value:
             return value.strip()
 
-    text = content.lower()
-    patterns = {
-        "mit license": "MIT License",
-        "apache license": "Apache License",
-        "creative commons": "Creative Commons",
-        "gpl": "GNU General Public License",
-    }
-    for needle, name in patterns.items():
-        if needle in text:
+    # One case-insensitive scan of the page instead of lower-casing it and
+    # searching once per needle; the earlier needle still wins on ties.
+    found = {match.group(0).lower() for match in _LICENSE_RE.finditer(content)}
+    for needle, name in _LICENSE_PATTERNS.items():
+        if needle in found:
             return name
     return None
 
 
-__all__ = ["HTTPScraper", "ScrapeResult", "detect_license"]
+__all__ = [
+    "DEFAULT_EXTRACTORS",
+    "FAST_EXTRACTORS",
+    "Extractor",
+    "HTTPScraper",
+    "ScrapeResult",
+    "detect_license",
+    "extract_with_readability",
+    "extract_with_trafilatura",
+    "strip_tags",
+]
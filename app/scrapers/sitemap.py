@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from .http import HTTPScraper
 
+# Child sitemaps of an index fetched concurrently; HTTPScraper still spaces
+# out requests to the same domain.
+_MAX_WORKERS = 8
+
 
 class SitemapScraper:
     """Parse sitemap XML documents into URL lists."""
@@ -15,30 +21,67 @@ class SitemapScraper:
         self.http = http
 
     def fetch(self, sitemap_url: str, *, respect_robots: bool = True) -> List[str]:
-        """Download *sitemap_url* and return contained URLs."""
+        """Download *sitemap_url* and return contained URLs.
+
+        When the document is a sitemap index, its child sitemaps are fetched
+        in parallel and their URLs are returned in index order.
+        """
+
+        is_index, urls = self._fetch(sitemap_url, respect_robots=respect_robots)
+        if not is_index or not urls:
+            return urls
 
+        def _fetch_child(url: str) -> List[str]:
+            # The protocol forbids nested indexes, so children are not expanded.
+            return self._fetch(url, respect_robots=respect_robots)[1]
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_WORKERS, len(urls)),
+            thread_name_prefix="sitemap",
+        ) as pool:
+            return [url for child in pool.map(_fetch_child, urls) for url in child]
+
+    def _fetch(
+        self, sitemap_url: str, *, respect_robots: bool
+    ) -> tuple[bool, List[str]]:
         payload = self.http.fetch_raw(sitemap_url, respect_robots=respect_robots)
         if payload is None:
-            return []
+            return False, []
         raw, _ = payload
-        return self.parse(raw)
+        return self._parse(raw)
 
     @staticmethod
     def parse(raw: bytes) -> List[str]:
         """Parse raw sitemap XML bytes into URL candidates."""
 
-        try:
-            root = ET.fromstring(raw)
-        except ET.ParseError:
-            return []
+        return SitemapScraper._parse(raw)[1]
+
+    @staticmethod
+    def _parse(raw: bytes) -> tuple[bool, List[str]]:
+        """Return whether *raw* is a sitemap index and the ``<loc>`` URLs."""
 
+        # Stream the document instead of building the whole tree: each
+        # <url>/<sitemap> entry is dropped from the root once it has closed.
+        root: ET.Element | None = None
+        depth = 0
         urls: List[str] = []
-        for loc in root.findall(".//{*}loc"):
-            if loc.text:
-                candidate = loc.text.strip()
-                if candidate:
-                    urls.append(candidate)
-        return urls
+        try:
+            for event, elem in ET.iterparse(io.BytesIO(raw), events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+                depth -= 1
+                if elem.tag == "loc" or elem.tag.endswith("}loc"):
+                    candidate = (elem.text or "").strip()
+                    if candidate:
+                        urls.append(candidate)
+                elif depth == 1 and root is not None:
+                    root.clear()
+        except ET.ParseError:
+            return False, []
+        return root is not None and root.tag.endswith("sitemapindex"), urls
 
 
 __all__ = ["SitemapScraper"]
@@ -7,12 +7,11 @@ retrieval capabilities offline.
 
 from __future__ import annotations
 
-import http.client
-import json
 import logging
 import threading
-from urllib.parse import urlparse
+from typing import Iterable
 
+from app.llm.client import _json_dumps, _json_loads, post_ollama
 from app.utils import np
 
 from config import get_settings
@@ -23,10 +22,41 @@ except Exception:  # pragma: no cover - optional dependency
     SentenceTransformer = None  # type: ignore[assignment]
 
 
+# Texts sent per Ollama request; larger inputs are split across several calls.
+_EMBED_BATCH_SIZE = 64
+
+# ``numpy_stub`` (see :mod:`app.utils.np`) only models 1-D vectors: without
+# NumPy the helpers below hand out a list of per-text rows instead of a matrix.
+_HAS_NUMPY = hasattr(np, "concatenate")
+
+# A ``(N, D)`` matrix with NumPy, a list of 1-D rows under ``numpy_stub``.
+Vectors = np.ndarray | list[np.ndarray]
+# ``int8`` codes produced by :func:`quantize_int8` for the matching Vectors.
+Int8Codes = np.ndarray | list[list[int]]
+
+
 class _LocalEncoder:
     def __init__(self) -> None:
         self._lock = threading.RLock()
         self._model: SentenceTransformer | None = None
+        self._prewarm_thread: threading.Thread | None = None
+
+    def prewarm(self) -> None:
+        """Start loading the model on a daemon thread, at most once."""
+
+        with self._lock:
+            if self._model is not None or self._prewarm_thread is not None:
+                return
+            self._prewarm_thread = threading.Thread(
+                target=self._load_quietly, name="embed-prewarm", daemon=True
+            )
+        self._prewarm_thread.start()
+
+    def _load_quietly(self) -> None:
+        try:
+            self._load()
+        except Exception as exc:  # pragma: no cover - optional dependency
+            logging.getLogger(__name__).debug("Local encoder prewarm failed: %s", exc)
 
     def _load(self) -> SentenceTransformer:
         if SentenceTransformer is None:  # pragma: no cover - dependency missing
@@ -51,7 +81,7 @@ class _LocalEncoder:
                     )
         return self._model
 
-    def encode(self, texts: list[str]) -> list[np.ndarray]:
+    def encode(self, texts: list[str]) -> Vectors:
         model = self._load()
         vectors = model.encode(
             texts,
@@ -59,21 +89,65 @@ class _LocalEncoder:
             show_progress_bar=False,
             device="cpu",
         )
-        return [np.asarray(vec, dtype=np.float32) for vec in vectors]
+        return _l2_normalise(_as_matrix(vectors))
 
 
 _ENCODER = _LocalEncoder()
 
 
-def _zero_vectors(texts: list[str]) -> list[np.ndarray]:
+def _l2_normalise(vectors: Vectors) -> Vectors:
+    """Scale each row of *vectors* to unit length.
+
+    A NumPy matrix is scaled in place; a list of rows (``numpy_stub``) is
+    copied into new unit-length rows. Zero rows are left untouched thanks to
+    the ``1e-12`` norm floor.
+    """
+
+    if isinstance(vectors, list):
+        rows = []
+        for row in vectors:
+            norm = max(float(np.linalg.norm(row)), 1e-12)
+            rows.append(np.array([value / norm for value in row], dtype=np.float32))
+        return rows
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, np.maximum(norms, 1e-12), out=vectors)
+    return vectors
+
+
+def _as_matrix(rows: Iterable[Iterable[float]]) -> Vectors:
+    if _HAS_NUMPY:
+        return np.asarray(rows, dtype=np.float32)
+    return [np.array(row, dtype=np.float32) for row in rows]
+
+
+def _stack(blocks: list[Vectors]) -> Vectors:
+    if len(blocks) == 1:
+        return blocks[0]
+    if _HAS_NUMPY:
+        return np.concatenate(blocks)
+    return [row for block in blocks for row in block]
+
+
+def _no_vectors() -> Vectors:
+    if _HAS_NUMPY:
+        return np.empty((0, 0), dtype=np.float32)
+    return []
+
+
+def _zero_vectors(texts: list[str]) -> Vectors:
+    if _HAS_NUMPY:
+        return np.zeros((len(texts), 1), dtype=np.float32)
     return [np.zeros(1, dtype=np.float32) for _ in texts]
 
 
-def embed_local(texts: list[str]) -> list[np.ndarray]:
-    """Embed ``texts`` using the local SentenceTransformer model."""
+def embed_local(texts: list[str]) -> Vectors:
+    """Embed ``texts`` using the local SentenceTransformer model.
+
+    One L2-normalised row of ``float32`` values is returned per text.
+    """
 
     if not texts:
-        return []
+        return _no_vectors()
     try:
         return _ENCODER.encode(texts)
     except RuntimeError:
@@ -84,7 +158,7 @@ def embed_ollama(
     texts: list[str],
     model: str | None = None,
     host: str | None = None,
-) -> list[np.ndarray]:
+) -> Vectors:
     """Generate embeddings for the given texts via an Ollama server.
 
     Parameters
@@ -100,53 +174,80 @@ def embed_ollama(
 
     Returns
     -------
-    list[np.ndarray]
-        A list of embedding vectors corresponding to ``texts``. Each vector is
-        a ``numpy.ndarray`` of ``float32``. If the Ollama backend cannot be
-        reached, a list of zero vectors of shape ``(1,)`` is returned instead.
+    Vectors
+        A contiguous ``(len(texts), dim)`` array of ``float32`` whose rows are
+        the L2-normalised embeddings of ``texts``, so a dot product between
+        two rows is their cosine similarity. If neither the Ollama backend nor the
+        local model is available, zero rows of shape ``(1,)`` are returned.
+        Under ``numpy_stub`` a list of 1-D vectors is returned instead.
     """
 
+    if not texts:
+        return _no_vectors()
+
     # Copy the memory configuration to avoid mutating the cached config
     settings = get_settings()
     memory_cfg = settings.memory
 
     model = model or memory_cfg.embed_model
-    host = host or getattr(memory_cfg, "embed_host", "127.0.0.1:11434")
-
-    parsed = urlparse(host if "://" in host else f"http://{host}")
-    scheme = (parsed.scheme or "http").lower()
-    if scheme == "https":
-        conn_cls = http.client.HTTPSConnection
-        default_port = 443
-    else:
-        conn_cls = http.client.HTTPConnection
-        default_port = 11434
-
-    conn = None
+    host = host or str(getattr(memory_cfg, "embed_host", "127.0.0.1:11434"))
+    if getattr(memory_cfg, "prewarm_local_encoder", False):
+        # Warm the offline fallback while the network request is in flight.
+        _ENCODER.prewarm()
+
     try:
-        conn = conn_cls(
-            parsed.hostname or "127.0.0.1",
-            parsed.port or default_port,
-            timeout=30,
-        )
-        payload = json.dumps({"model": model, "input": texts})
-        conn.request(
-            "POST",
-            "/api/embeddings",
-            body=payload,
-            headers={"Content-Type": "application/json"},
-        )
-        resp = conn.getresponse()
-        if resp.status != 200:
-            raise RuntimeError(f"Embedding request failed: {resp.status}")
-        data = json.loads(resp.read())
-        return [np.array(v, dtype=np.float32) for v in data["embeddings"]]
+        blocks: list[Vectors] = []
+        # Batches share one pooled keep-alive connection instead of paying a
+        # TCP handshake per call.
+        for start in range(0, len(texts), _EMBED_BATCH_SIZE):
+            batch = texts[start : start + _EMBED_BATCH_SIZE]
+            payload = _json_dumps({"model": model, "input": batch})
+            status, body = post_ollama(host, "/api/embeddings", payload)
+            if status != 200:
+                raise RuntimeError(f"Embedding request failed: {status}")
+            data = _json_loads(body)
+            # One contiguous (N, D) block per batch instead of a row per vector.
+            blocks.append(_l2_normalise(_as_matrix(data["embeddings"])))
+        return _stack(blocks)
     except Exception as exc:  # pragma: no cover - network
         logging.getLogger(__name__).warning("Embedding backend unreachable: %s", exc)
         return embed_local(texts)
-    finally:
-        if conn is not None:
-            try:
-                conn.close()
-            except Exception:  # pragma: no cover - defensive
-                pass
+
+
+def quantize_int8(vectors: Vectors) -> tuple[Int8Codes, np.ndarray]:
+    """Symmetrically quantise each row of *vectors* to ``int8``.
+
+    Returns ``(codes, scales)`` where ``codes`` has shape ``(N, D)`` and
+    ``codes[i] * scales[i]`` approximates ``vectors[i]``. The dot product of
+    two rows is therefore ``codes_a.astype(int32) @ codes_b * scale_a * scale_b``.
+    For a list of rows (``numpy_stub``) the codes are lists of Python ints in
+    the ``int8`` range, since the stub has no integer arrays.
+    """
+
+    if isinstance(vectors, list):
+        rows: list[list[int]] = []
+        row_scales: list[float] = []
+        for row in vectors:
+            peak = max((abs(float(value)) for value in row), default=0.0)
+            scale = max(peak, 1e-12) / 127.0
+            row_scales.append(scale)
+            rows.append([int(round(float(value) / scale)) for value in row])
+        return rows, np.array(row_scales, dtype=np.float32)
+    peaks = np.abs(vectors).max(axis=1, initial=0.0)
+    scales = (np.maximum(peaks, 1e-12) / 127.0).astype(np.float32)
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+def embed_ollama_int8(
+    texts: list[str],
+    model: str | None = None,
+    host: str | None = None,
+) -> tuple[Int8Codes, np.ndarray]:
+    """Like :func:`embed_ollama` but return ``int8`` codes and per-row scales.
+
+    Storing the codes takes a quarter of the ``float32`` footprint; callers
+    that need full precision keep using :func:`embed_ollama`.
+    """
+
+    return quantize_int8(embed_ollama(texts, model=model, host=host))
@@ -107,21 +107,125 @@ def _resolve_attribute(module: object, attribute: str) -> object:
     return obj
 
 
+# origin -> ((st_ino, st_size, st_mtime_ns, st_ctime_ns), raw SHA-256 digest)
+# of the last hashed version.
+_SIG_CACHE: dict[str, tuple[tuple[int, int, int, int], bytes]] = {}
+
+
+def clear_signature_cache() -> None:
+    """Forget every cached module digest."""
+
+    _SIG_CACHE.clear()
+
+
 def compute_module_signature(module_name: str) -> str | None:
-    """Return the SHA-256 digest of *module_name*'s source file."""
+    """Return the SHA-256 digest of *module_name*'s source file.
+
+    Digests are cached per source file and reused while its inode, size,
+    modification time and status-change time are unchanged, so repeated
+    reloads only ``stat`` the file. The ctime cannot be set from userspace,
+    so rewriting a module and restoring its mtime still forces a re-hash.
+    """
+
+    digest = _module_digest(module_name)
+    return None if digest is None else digest.hex()
+
+
+def _module_digest(module_name: str) -> bytes | None:
+    """Return the raw SHA-256 digest behind :func:`compute_module_signature`."""
 
     spec = find_spec(module_name)
-    if spec is None or spec.origin in {None, "built-in", "frozen"}:
+    if spec is None:
         return None
-    path = Path(spec.origin)
+    origin = spec.origin
+    if origin is None or origin in {"built-in", "frozen"}:
+        return None
+    path = Path(origin)
     try:
-        data = path.read_bytes()
+        st = path.stat()
+        key = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        cached = _SIG_CACHE.get(origin)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # Stream the file straight into OpenSSL instead of materialising it.
+        with path.open("rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").digest()
     except OSError:
         logging.debug(
             "Failed to read module %s for signature", module_name, exc_info=True
         )
         return None
-    return hashlib.sha256(data).hexdigest()
+    _SIG_CACHE[origin] = (key, digest)
+    return digest
+
+
+def _signature_matches(declared: str, actual: bytes) -> bool:
+    """Compare a declared hex signature with a raw digest in constant time."""
+
+    try:
+        expected = bytes.fromhex(declared)
+    except (TypeError, ValueError):
+        return False
+    return hmac.compare_digest(expected, actual)
+
+
+def _batch_signatures(module_names: Iterable[str]) -> dict[str, bytes | None]:
+    """Return the raw digest of every distinct module in *module_names*."""
+
+    signatures: dict[str, bytes | None] = {}
+    for name in dict.fromkeys(module_names):
+        try:
+            signatures[name] = _module_digest(name)
+        except (ImportError, ValueError):
+            logging.debug("Unable to locate module %s", name, exc_info=True)
+            signatures[name] = None
+    return signatures
+
+
+def _merkle_root(digests: list[bytes]) -> bytes:
+    """Return the SHA-256 Merkle root of *digests*.
+
+    Leaves are sorted so the root does not depend on manifest order; an odd
+    node at any level is promoted unchanged to the next one.
+    """
+
+    level = sorted(digests)
+    if not level:
+        return hashlib.sha256(b"").digest()
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(level[index] + level[index + 1]).digest()
+            for index in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def compute_manifest_signature(module_names: Iterable[str]) -> str | None:
+    """Return the ``manifest_signature`` covering every module in *module_names*.
+
+    ``None`` is returned when one of the modules cannot be hashed.
+    """
+
+    digests = list(_batch_signatures(module_names).values())
+    if any(digest is None for digest in digests):
+        return None
+    return _merkle_root(digests).hex()  # type: ignore[arg-type]
+
+
+def _manifest_root_matches(
+    declared: object, signatures: dict[str, bytes | None]
+) -> bool:
+    """Check the manifest-wide signature against the hashed modules."""
+
+    if not isinstance(declared, str) or not signatures:
+        return False
+    digests = list(signatures.values())
+    if any(digest is None for digest in digests):
+        return False
+    return _signature_matches(declared, _merkle_root(digests))  # type: ignore[arg-type]
 
 
 def discover_entry_point_plugins(group: str = "watcher.plugins") -> list[LoadedPlugin]:
@@ -182,8 +286,8 @@ def discover_entry_point_plugins(group: str = "watcher.plugins") -> list[LoadedP
                 )
                 continue
 
-            actual_signature = compute_module_signature(module_name)
-            if actual_signature is None or not hmac.compare_digest(
+            actual_signature = _module_digest(module_name)
+            if actual_signature is None or not _signature_matches(
                 declared_signature, actual_signature
             ):
                 logging.error(
@@ -272,11 +376,30 @@ def reload_plugins(base: Location | None = None) -> list[LoadedPlugin]:
         except Exception:  # pragma: no cover - best effort
             logging.exception("Invalid plugins.toml")
         else:
-            for item in data.get("plugins", []):
+            entries = data.get("plugins", [])
+            # Hash every declared module up front, once per distinct module,
+            # before any plugin gets imported.
+            signatures = _batch_signatures(
+                module
+                for module, _, attribute in (
+                    str(item.get("path") or "").partition(":") for item in entries
+                )
+                if module and attribute
+            )
+            # A valid manifest-wide Merkle root vouches for every module at
+            # once; per-plugin signatures are only checked as a fallback.
+            trusted = _manifest_root_matches(
+                data.get("manifest_signature"), signatures
+            )
+            if "manifest_signature" in data and not trusted:
+                logging.warning(
+                    "Manifest signature mismatch, checking plugins individually"
+                )
+            for item in entries:
                 path = item.get("path")
                 api_version = item.get("api_version")
                 signature = item.get("signature")
-                if not path or not api_version or not signature:
+                if not path or not api_version or not (signature or trusted):
                     logging.warning(
                         "Incomplete plugin definition in manifest: %s", item
                     )
@@ -295,11 +418,13 @@ def reload_plugins(base: Location | None = None) -> list[LoadedPlugin]:
                     logging.warning("Invalid plugin path %s", path)
                     continue
 
-                actual_signature = compute_module_signature(module_name)
+                actual_signature = signatures.get(module_name)
                 if actual_signature is None:
                     logging.error("Unable to compute signature for %s", module_name)
                     continue
-                if not hmac.compare_digest(signature, actual_signature):
+                if not trusted and not _signature_matches(
+                    signature, actual_signature
+                ):
                     logging.error("Signature mismatch for plugin %s", path)
                     continue
 
@@ -321,7 +446,7 @@ def reload_plugins(base: Location | None = None) -> list[LoadedPlugin]:
                         module=module_name,
                         attribute=attribute,
                         api_version=api_version,
-                        signature=signature,
+                        signature=signature or actual_signature.hex(),
                         origin="manifest",
                     )
                 )
@@ -335,7 +460,9 @@ __all__ = [
     "LoadedPlugin",
     "SUPPORTED_PLUGIN_API_VERSION",
     "DEFAULT_MANIFEST",
+    "clear_signature_cache",
     "compute_module_signature",
+    "compute_manifest_signature",
     "reload_plugins",
     "discover_entry_point_plugins",
 ]
@@ -1,9 +1,18 @@
 import pytest
 
-from app.llm.client import chunk_prompt
+from app.llm.client import chunk_prompt, iter_chunks
 
 
 @pytest.mark.parametrize("size", [0, -1])
 def test_chunk_prompt_invalid_size(size: int) -> None:
     with pytest.raises(ValueError, match="positive"):
         chunk_prompt("hello", size=size)
+
+
+def test_iter_chunks_is_lazy_and_validates_eagerly() -> None:
+    chunks = iter_chunks("abcde", size=2)
+
+    assert next(chunks) == "ab"
+    assert list(chunks) == ["cd", "e"]
+    with pytest.raises(ValueError, match="positive"):
+        iter_chunks("hello", size=0)
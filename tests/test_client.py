@@ -1,8 +1,19 @@
 import http.client
+import io
+import json
+import logging
+import threading
 from types import SimpleNamespace
 
+import pytest
+
 from app.core.engine import Engine
-from app.llm.client import Client, generate_ollama
+from app.llm.client import (
+    Client,
+    _resolve_target,
+    close_connections,
+    generate_ollama,
+)
 
 
 def test_client_fallback_echo() -> None:
@@ -76,19 +87,32 @@ def test_generate_ollama_https_uses_https_connection(monkeypatch) -> None:
     class DummyResponse:
         status = 200
 
-        def read(self) -> str:
-            return "{\"response\": \"ok\"}"
+        def __init__(self) -> None:
+            self._body = io.BytesIO(
+                b'{"response": " o", "done": false}\n'
+                b'{"response": "k ", "done": false}\n'
+                b'{"response": "", "done": true}\n'
+            )
+
+        def readline(self) -> bytes:
+            return self._body.readline()
 
-    calls: dict[str, object] = {}
+        def read(self) -> bytes:
+            return self._body.read()
+
+    calls: dict[str, object] = {"opened": 0, "requests": 0}
 
     class DummyConnection:
         def __init__(self, host: str, port: int, timeout: int) -> None:
+            calls["opened"] += 1
             calls["host"] = host
             calls["port"] = port
             calls["timeout"] = timeout
 
         def request(self, method: str, path: str, *, body: str, headers: dict[str, str]) -> None:
             calls["request"] = (method, path, body, headers)
+            calls["payload"] = json.loads(body)
+            calls["requests"] += 1
 
         def getresponse(self) -> DummyResponse:
             calls["getresponse"] = True
@@ -101,10 +125,450 @@ def test_generate_ollama_https_uses_https_connection(monkeypatch) -> None:
         http.client, "HTTPSConnection", lambda *args, **kwargs: DummyConnection(*args, **kwargs)
     )
 
+    close_connections()
     result = generate_ollama("bonjour", host="https://example.com", model="mistral")
+    again = generate_ollama("encore", host="https://example.com", model="mistral")
 
-    assert result == "ok"
+    assert result == again == "ok"
     assert calls["host"] == "example.com"
     assert calls["port"] == 443
     assert calls["timeout"] == 30
+    assert calls["opened"] == 1
+    assert calls["payload"] == {"model": "mistral", "prompt": "encore", "stream": True}
+    assert calls["requests"] == 2
+    assert "closed" not in calls
+
+    close_connections()
     assert calls["closed"] is True
+
+
+def test_ollama_chunks_dispatched_concurrently_in_order(monkeypatch) -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_generate_ollama(prompt: str, *, host: str, model: str) -> str:
+        barrier.wait()
+        return prompt.upper()
+
+    monkeypatch.setattr("app.llm.client.generate_ollama", fake_generate_ollama)
+    monkeypatch.setattr(
+        "app.llm.client.iter_chunks", lambda prompt: iter(["a", "b", "c"])
+    )
+
+    client = Client(model="llama3.2:3b", ctx=1)
+    answer, trace = client.generate("abc" * 10, separator="|")
+
+    assert answer == "A|B|C"
+    assert trace.split(" -> ") == ["ollama:0", "ollama:1", "ollama:2", "success"]
+
+
+def test_response_cache_reuses_answers_per_chunk(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_generate_ollama(prompt: str, *, host: str, model: str) -> str:
+        calls.append(prompt)
+        return f"generated:{prompt}"
+
+    monkeypatch.setattr("app.llm.client.generate_ollama", fake_generate_ollama)
+
+    client = Client(model="llama3.2:3b")
+    client.cache_size = 1
+    client.temperature = 0.0
+    assert client.generate("un")[0] == "generated:un"
+    assert client.generate("un")[0] == "generated:un"
+    client.generate("deux")
+    client.generate("un")
+
+    assert calls == ["un", "deux", "un"]
+
+
+def test_response_cache_skipped_when_sampling(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_generate_ollama(prompt: str, *, host: str, model: str) -> str:
+        calls.append(prompt)
+        return f"generated:{prompt}"
+
+    monkeypatch.setattr("app.llm.client.generate_ollama", fake_generate_ollama)
+
+    client = Client(model="llama3.2:3b")
+    client.cache_size = 4
+    client.temperature = 0.2
+    client.generate("un")
+    client.generate("un")
+
+    assert calls == ["un", "un"]
+    assert client.cache_stats == {"hits": 0, "misses": 0}
+
+
+def test_resolve_target_defaults() -> None:
+    assert _resolve_target("127.0.0.1:11434") == ("http", "127.0.0.1", 11434)
+    assert _resolve_target("localhost") == ("http", "localhost", 11434)
+    assert _resolve_target("https://ollama.example") == ("https", "ollama.example", 443)
+
+
+def test_json_helpers_round_trip_without_orjson(monkeypatch) -> None:
+    import app.llm.client as client_module
+
+    monkeypatch.setattr(client_module, "orjson", None)
+    payload = {"model": "mistral", "prompt": "élan"}
+
+    encoded = client_module._json_dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert client_module._json_loads(encoded) == payload
+
+
+def test_ollama_long_prompt_keeps_chunk_order(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "app.llm.client.generate_ollama", lambda prompt, *, host, model: prompt[0]
+    )
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    prompt = "".join(letter * 1000 for letter in letters)
+
+    answer, trace = Client(model="llama3.2:3b").generate(prompt)
+
+    assert answer == letters
+    assert trace.split(" -> ")[-2:] == ["ollama:25", "success"]
+
+
+def test_llama_model_loaded_once(monkeypatch, tmp_path) -> None:
+    import app.llm.client as client_module
+
+    loads: list[dict[str, object]] = []
+
+    class FakeLlama:
+        def __init__(self, **kwargs) -> None:
+            loads.append(kwargs)
+
+    model_file = tmp_path / "model.gguf"
+    model_file.write_bytes(b"gguf")
+    monkeypatch.setattr(client_module, "Llama", FakeLlama)
+    monkeypatch.setattr(client_module, "LlamaRAMCache", None)
+
+    client = Client()
+    client.model_path = model_file
+    first = client._ensure_llama()
+    model_file.unlink()
+
+    assert client._ensure_llama() is first
+    assert len(loads) == 1
+    assert loads[0]["model_path"] == str(model_file)
+    assert loads[0]["n_threads_batch"] == client.threads_batch
+    assert loads[0]["n_batch"] == 2048
+    assert loads[0]["n_ubatch"] == 512
+    assert loads[0]["use_mmap"] is True
+    assert loads[0]["use_mlock"] is False
+
+
+def test_llama_cpp_reuses_prefix_cache_and_system_message(monkeypatch, tmp_path) -> None:
+    import app.llm.client as client_module
+
+    class FakeCache:
+        def __init__(self, capacity_bytes: int) -> None:
+            self.capacity_bytes = capacity_bytes
+
+    class FakeLlama:
+        def __init__(self, **kwargs) -> None:
+            self.cache = None
+            self.messages: list[list[dict[str, str]]] = []
+
+        def set_cache(self, cache) -> None:
+            self.cache = cache
+
+        def create_chat_completion(self, *, messages, temperature, max_tokens):
+            self.messages.append(messages)
+            return {"choices": [{"message": {"content": f" {messages[1]['content']} "}}]}
+
+    model_file = tmp_path / "model.gguf"
+    model_file.write_bytes(b"gguf")
+    monkeypatch.setattr(client_module, "Llama", FakeLlama)
+    monkeypatch.setattr(client_module, "LlamaRAMCache", FakeCache)
+
+    client = Client()
+    client.model_path = model_file
+    answer, trace = client.generate("a" * 1000 + "b", separator="|")
+
+    llama = client._llama_model
+    assert answer == "a" * 1000 + "|b"
+    assert trace.split(" -> ") == ["llama.cpp:0", "llama.cpp:1", "success"]
+    assert isinstance(llama.cache, FakeCache)
+    assert llama.messages[0][0] is llama.messages[1][0]
+    assert llama.messages[0][0]["role"] == "system"
+
+
+def test_llama_model_preloaded_in_background(monkeypatch, tmp_path) -> None:
+    import app.llm.client as client_module
+
+    class FakeLlama:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+
+    model_file = tmp_path / "model.gguf"
+    model_file.write_bytes(b"gguf")
+    settings = client_module.get_settings()
+    monkeypatch.setattr(client_module, "Llama", FakeLlama)
+    monkeypatch.setattr(client_module, "LlamaRAMCache", None)
+    monkeypatch.setattr(settings.llm, "model_path", model_file)
+
+    client = Client()
+    assert client._preload_thread is not None
+    client._preload_thread.join(timeout=5)
+
+    assert isinstance(client._llama_model, FakeLlama)
+    assert client._ensure_llama() is client._llama_model
+
+
+def test_resolve_quantized_prefers_existing_variant(tmp_path) -> None:
+    from app.llm.client import _resolve_quantized
+
+    configured = tmp_path / "smollm.Q8_0.gguf"
+    variant = tmp_path / "smollm.Q4_K_M.gguf"
+
+    assert _resolve_quantized(configured, "Q4_K_M") == configured
+    variant.write_bytes(b"gguf")
+    assert _resolve_quantized(configured, "Q4_K_M") == variant
+    assert _resolve_quantized(configured, None) == configured
+
+
+def test_generate_failure_logs_warning_without_traceback(caplog) -> None:
+    client = Client()
+    logger = logging.getLogger("app.llm.client")
+
+    with caplog.at_level(logging.WARNING, logger="app.llm.client"):
+        logger.setLevel(logging.WARNING)
+        try:
+            client.generate("salut")
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+    records = [r for r in caplog.records if r.name == "app.llm.client"]
+    assert records and records[-1].levelno == logging.WARNING
+    assert records[-1].exc_info is None
+    assert records[-1].getMessage().startswith("Failed to generate response")
+
+
+def test_trace_labels_beyond_precomputed_range() -> None:
+    from app.llm.client import _OLLAMA_LABELS, _trace_label
+
+    assert _trace_label(_OLLAMA_LABELS, "ollama", 3) == "ollama:3"
+    assert _trace_label(_OLLAMA_LABELS, "ollama", 1000) == "ollama:1000"
+
+
+def test_stream_ollama_yields_fragments_and_drops_broken_connections(monkeypatch) -> None:
+    from app.llm import client as client_module
+
+    bodies = [
+        b'{"response": "Bon", "done": false}\n{"response": "jour", "done": true}\n',
+        b'{"response": "x", "done": false}\n{"error": "model not found"}\n',
+    ]
+    closed: list[bool] = []
+
+    class FakeResponse:
+        status = 200
+        will_close = False
+
+        def __init__(self, body: bytes) -> None:
+            self._body = io.BytesIO(body)
+
+        def readline(self) -> bytes:
+            return self._body.readline()
+
+        def read(self) -> bytes:
+            return self._body.read()
+
+    class FakeConnection:
+        def __init__(self, host: str, port: int, timeout: int) -> None:
+            self.body = b""
+
+        def request(self, method, path, *, body, headers) -> None:
+            self.body = bodies.pop(0)
+
+        def getresponse(self) -> FakeResponse:
+            return FakeResponse(self.body)
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(http.client, "HTTPConnection", FakeConnection)
+    close_connections()
+
+    fragments = list(client_module.stream_ollama("salut", host="local", model="m"))
+    assert fragments == ["Bon", "jour"]
+    assert closed == []
+
+    with pytest.raises(RuntimeError, match="model not found"):
+        list(client_module.stream_ollama("salut", host="local", model="m"))
+    assert closed == [True]
+    close_connections()
+
+
+def test_chunk_executor_is_shared_between_clients() -> None:
+    from app.llm.client import _chunk_executor
+
+    assert _chunk_executor() is _chunk_executor()
+
+
+def test_generate_rejects_oversized_prompts(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        "app.llm.client.generate_ollama",
+        lambda prompt, *, host, model: calls.append(prompt) or prompt,
+    )
+    client = Client(model="llama3.2:3b")
+    client.max_prompt_chars = 10
+
+    with pytest.raises(ValueError, match="10 characters"):
+        client.generate("x" * 11)
+    assert client.generate("x" * 10)[0] == "x" * 10
+    assert calls == ["x" * 10]
+
+
+def test_stream_ollama_reconnects_once_after_idle_disconnect(monkeypatch) -> None:
+    opened: list["FakeConnection"] = []
+
+    class FakeResponse:
+        status = 200
+        will_close = False
+
+        def __init__(self) -> None:
+            self._body = io.BytesIO(b'{"response": "ok", "done": true}\n')
+
+        def readline(self) -> bytes:
+            return self._body.readline()
+
+        def read(self) -> bytes:
+            return self._body.read()
+
+    class FakeConnection:
+        def __init__(self, host: str, port: int, timeout: int) -> None:
+            self.stale = False
+            self.closed = False
+            opened.append(self)
+
+        def request(self, method, path, *, body, headers) -> None:
+            pass
+
+        def getresponse(self) -> FakeResponse:
+            if self.stale:
+                raise http.client.RemoteDisconnected("idle timeout")
+            return FakeResponse()
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(http.client, "HTTPConnection", FakeConnection)
+    close_connections()
+
+    assert generate_ollama("a", host="local", model="m") == "ok"
+    opened[0].stale = True
+    assert generate_ollama("b", host="local", model="m") == "ok"
+
+    assert len(opened) == 2
+    assert opened[0].closed is True
+    assert opened[1].closed is False
+    close_connections()
+
+
+def test_ollama_separator_kept_around_empty_chunk_answers(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "app.llm.client.generate_ollama",
+        lambda prompt, *, host, model: "" if prompt[0] == "a" else prompt[0],
+    )
+    prompt = "a" * 1000 + "b" * 1000 + "c"
+
+    answer, _ = Client(model="llama3.2:3b", ctx=1).generate(prompt, separator="|")
+
+    assert answer == "|b|c"
+
+
+def test_ollama_repeated_chunks_sent_once(monkeypatch) -> None:
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def fake_generate_ollama(prompt: str, *, host: str, model: str) -> str:
+        with lock:
+            calls.append(prompt[0])
+        return prompt[0]
+
+    monkeypatch.setattr("app.llm.client.generate_ollama", fake_generate_ollama)
+    prompt = "".join(letter * 1000 for letter in "abab")
+
+    answer, trace = Client(model="llama3.2:3b", ctx=1).generate(prompt)
+
+    assert answer == "abab"
+    assert sorted(calls) == ["a", "b"]
+    assert trace.count("ollama:") == 4
+
+
+def test_response_cache_expires_and_counts_hits(monkeypatch) -> None:
+    import app.llm.client as client_module
+
+    now = [100.0]
+    calls: list[str] = []
+
+    def fake_generate_ollama(prompt: str, *, host: str, model: str) -> str:
+        calls.append(prompt)
+        return prompt.upper()
+
+    monkeypatch.setattr(client_module, "generate_ollama", fake_generate_ollama)
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    client = Client(model="llama3.2:3b")
+    client.cache_size = 4
+    client.cache_ttl = 10.0
+    client.temperature = 0.0
+    client.generate("un")
+    client.generate("un")
+    now[0] += 11
+    client.generate("un")
+
+    assert calls == ["un", "un"]
+    assert client.cache_stats == {"hits": 1, "misses": 2}
+
+
+def test_prewarm_connection_parks_connected_socket(monkeypatch) -> None:
+    import app.llm.client as client_module
+
+    events: list[str] = []
+
+    class DummyConnection:
+        def __init__(self, host: str, port: int, timeout: int | None = None) -> None:
+            self.host = host
+
+        def connect(self) -> None:
+            events.append(f"connect:{self.host}")
+
+        def close(self) -> None:
+            events.append("close")
+
+    monkeypatch.setattr(client_module.http.client, "HTTPConnection", DummyConnection)
+    close_connections()
+
+    try:
+        client_module.prewarm_connection("warm.example:11434")
+        conn, reused = client_module._acquire_connection(
+            "http", "warm.example", 11434
+        )
+
+        assert reused is True
+        assert isinstance(conn, DummyConnection)
+        assert events == ["connect:warm.example"]
+    finally:
+        close_connections()
+
+
+def test_ollama_prompt_fitting_context_sent_in_one_request(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        "app.llm.client.generate_ollama",
+        lambda prompt, *, host, model: calls.append(prompt) or "ok",
+    )
+    prompt = "a" * 1000 + "b" * 1000 + "c" * 500
+
+    answer, trace = Client(model="llama3.2:3b", ctx=2048).generate(prompt)
+    Client(model="llama3.2:3b", ctx=512).generate(prompt)
+
+    assert answer == "ok"
+    assert trace.split(" -> ") == ["ollama:0", "success"]
+    assert calls[0] == prompt
+    assert sorted(len(chunk) for chunk in calls[1:]) == [500, 1000, 1000]
@@ -1,7 +1,13 @@
+import json
 import logging
+import threading
 from types import SimpleNamespace
 
+import pytest
+
 from app.configuration import MemorySettings
+from app.llm.client import close_connections
+from app.utils import np
 from app.tools.embeddings import embed_ollama
 from config import clear_settings_cache, get_settings
 
@@ -124,3 +130,131 @@ def test_embed_ollama_does_not_mutate_config(monkeypatch):
     embed_ollama(["hi"], model="bar", host="another.com:5678")
     assert get_settings().memory.model_dump() == original_memory.model_dump()
     clear_settings_cache()
+
+
+class _FakeOllamaResponse:
+    status = 200
+    will_close = False
+
+    def __init__(self, body):
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+def _fake_ollama(monkeypatch, vector):
+    """Serve *vector* for every text and record connections and batches."""
+
+    opened = []
+    batches = []
+
+    class FakeConn:
+        def __init__(self, host, port, *args, **kwargs):
+            opened.append((host, port))
+
+        def request(self, method, path, body=None, headers=None):
+            batches.append(json.loads(body)["input"])
+
+        def getresponse(self):
+            vectors = [vector for _ in batches[-1]]
+            return _FakeOllamaResponse(json.dumps({"embeddings": vectors}).encode())
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr("http.client.HTTPConnection", FakeConn)
+    return opened, batches
+
+
+def test_embed_ollama_batches_over_one_pooled_connection(monkeypatch):
+    opened, batches = _fake_ollama(monkeypatch, [1.0, 0.0])
+    monkeypatch.setattr("app.tools.embeddings._EMBED_BATCH_SIZE", 2)
+    try:
+        vecs = embed_ollama(["a", "b", "c"], host="pooled.test:1111")
+    finally:
+        close_connections()
+
+    assert len(vecs) == 3 and all(len(vec) == 2 for vec in vecs)
+    assert batches == [["a", "b"], ["c"]]
+    assert opened == [("pooled.test", 1111)]
+
+
+def test_embed_ollama_returns_matrix_with_numpy(monkeypatch):
+    if not hasattr(np, "concatenate"):
+        pytest.skip("numpy_stub has no 2-D arrays")
+    _fake_ollama(monkeypatch, [1.0, 0.0])
+    monkeypatch.setattr("app.tools.embeddings._EMBED_BATCH_SIZE", 2)
+    try:
+        vecs = embed_ollama(["a", "b", "c"], host="matrix.test:1111")
+    finally:
+        close_connections()
+
+    assert vecs.shape == (3, 2)
+    assert vecs.dtype == np.float32
+
+
+def test_embed_ollama_returns_unit_vectors(monkeypatch):
+    _fake_ollama(monkeypatch, [3.0, 4.0])
+    try:
+        vecs = embed_ollama(["a", "b"], host="unit.test:1111")
+    finally:
+        close_connections()
+
+    assert len(vecs) == 2
+    for vec in vecs:
+        assert list(vec) == pytest.approx([0.6, 0.8])
+        assert np.linalg.norm(vec) == pytest.approx(1.0)
+
+
+def test_quantize_int8_rows():
+    from app.tools.embeddings import quantize_int8
+
+    rows = [np.array([0.6, -0.8, 0.0]), np.array([0.0, 0.0, 0.0])]
+    codes, scales = quantize_int8(rows)
+
+    assert codes == [[95, -127, 0], [0, 0, 0]]
+    # numpy_stub has no int8 dtype: the codes are exact Python integers.
+    assert all(type(code) is int for row in codes for code in row)
+    assert float(scales[0]) == pytest.approx(0.8 / 127, rel=1e-6)
+
+
+def test_quantize_int8_round_trips_within_one_step():
+    from app.tools.embeddings import quantize_int8
+
+    if not hasattr(np, "concatenate"):
+        pytest.skip("numpy_stub has no int8 arrays")
+    vectors = np.array([[0.6, -0.8, 0.0], [0.0, 0.0, 0.0]], dtype=np.float32)
+    codes, scales = quantize_int8(vectors)
+
+    assert codes.dtype == np.int8 and scales.dtype == np.float32
+    assert codes[0].tolist() == [95, -127, 0]
+    assert codes[1].tolist() == [0, 0, 0]
+    assert np.allclose(codes * scales[:, None], vectors, atol=scales.max())
+    approx = int(codes[0].astype(np.int32) @ codes[0]) * float(scales[0]) ** 2
+    assert abs(approx - 1.0) < 0.01
+
+
+def test_embed_ollama_prewarms_local_encoder_when_enabled(monkeypatch):
+    from app.tools import embeddings
+
+    loads = []
+
+    def fake_load():
+        loads.append(threading.current_thread().name)
+        raise RuntimeError("no local model")
+
+    encoder = embeddings._LocalEncoder()
+    monkeypatch.setattr(encoder, "_load", fake_load)
+    monkeypatch.setattr(embeddings, "_ENCODER", encoder)
+    monkeypatch.setattr(embeddings, "post_ollama", lambda *a: (500, b""))
+    stub_settings = SimpleNamespace(memory=MemorySettings(prewarm_local_encoder=True))
+    monkeypatch.setattr("app.tools.embeddings.get_settings", lambda: stub_settings)
+
+    vecs = embed_ollama(["hi"], host="warm.test:1")
+    encoder._prewarm_thread.join(timeout=5)
+    encoder.prewarm()
+
+    assert len(vecs) == 1 and len(vecs[0]) == 1
+    assert "embed-prewarm" in loads
+    assert loads.count("embed-prewarm") == 1
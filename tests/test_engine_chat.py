@@ -72,6 +72,40 @@ def test_chat_includes_retrieved_terms(tmp_path, monkeypatch):
     assert "please" in eng.client.prompt
 
 
+def test_chat_truncates_excerpts_to_prompt_limit(tmp_path, monkeypatch):
+    def fake_embed(texts, model="nomic-embed-text"):
+        return [np.array([1.0])]
+
+    monkeypatch.setattr("app.core.memory.embed_ollama", fake_embed)
+
+    eng = Engine.__new__(Engine)
+    eng.mem = Memory(tmp_path / "mem.db")
+    eng.mem.set_offline(False)
+    eng.critic = Critic()
+
+    def fake_search(self, query: str, top_k: int = 8):
+        return [(0.9, 1, "ctx", "x" * 500)]
+
+    monkeypatch.setattr(Memory, "search", fake_search)
+
+    class DummyClient:
+        max_prompt_chars = 400
+
+        def __init__(self):
+            self.prompt = None
+
+        def generate(self, prompt: str) -> tuple[str, str]:
+            self.prompt = prompt
+            return "pong", "dummy-trace"
+
+    eng.client = DummyClient()
+
+    prompt = "please " + "word " * 60 + "thank you"
+    assert eng.chat(prompt) == "pong"
+    assert len(eng.client.prompt) == 400
+    assert eng.client.prompt.startswith(prompt + "\n\nx")
+
+
 def test_chat_suggests_details_without_llm(tmp_path, monkeypatch):
     def fake_embed(texts, model="nomic-embed-text"):
         return [np.array([1.0])]
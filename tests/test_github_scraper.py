@@ -137,3 +137,36 @@ def test_github_scraper_limits_reference_files_to_supported_paths() -> None:
     assert bundle is not None
     assert bundle.documents == []
     assert all("archive.zip" not in call[0] for call in http.calls)
+
+
+def test_github_scraper_ignores_malformed_json(monkeypatch) -> None:
+    import app.scrapers.github as github_module
+
+    repo_url = "https://api.github.com/repos/octocat/Hello-World"
+    http = StubHTTP({repo_url: (b'{"default_branch": "main"', {})})
+    scraper = GitHubScraper(http)
+
+    assert scraper.fetch_repository("octocat/Hello-World") is None
+    monkeypatch.setattr(github_module, "orjson", None)
+    http.payloads[repo_url] = (b"\xff\xfe not json", {})
+    assert scraper.fetch_repository("octocat/Hello-World") is None
+    http.payloads[repo_url] = ('{"default_branch": "dév"}'.encode("utf-8"), {})
+    info = scraper.fetch_repository("octocat/Hello-World")
+    assert info is not None and info.default_branch == "dév"
+
+
+def test_github_scraper_parses_repository_urls_and_shorthand() -> None:
+    scraper = GitHubScraper(StubHTTP({}))
+
+    assert scraper._parse_repository("octocat/Hello-World") == ("octocat", "Hello-World")
+    assert scraper._parse_repository("octocat/Hello-World/") == ("octocat", "Hello-World")
+    assert scraper._parse_repository("https://github.com/octocat/Hello-World") == (
+        "octocat",
+        "Hello-World",
+    )
+    assert scraper._parse_repository("//github.com/octocat/Hello-World/") == (
+        "octocat",
+        "Hello-World",
+    )
+    assert scraper._parse_repository("octocat") == (None, None)
+    assert scraper._parse_repository("https://github.com/octocat") == (None, None)
@@ -3,6 +3,8 @@ from collections import defaultdict
 from typing import Dict, List, Mapping
 from urllib.error import HTTPError
 
+import pytest
+
 from app.scrapers.http import HTTPScraper
 
 
@@ -15,8 +17,12 @@ class FakeResponse:
             for key, value in headers.items():
                 self.headers[key] = value
 
-    def read(self) -> bytes:
-        return self._body
+    def read(self, amt: int = -1) -> bytes:
+        # Behave like a real response: the body is consumed by reading it.
+        if amt < 0:
+            amt = len(self._body)
+        chunk, self._body = self._body[:amt], self._body[amt:]
+        return chunk
 
     def __enter__(self) -> "FakeResponse":  # pragma: no cover - context manager boilerplate
         return self
@@ -114,3 +120,353 @@ def test_fetch_raw_returns_payload(monkeypatch):
     body, headers = raw
     assert json.loads(body.decode("utf-8")) == {"hello": "world"}
     assert headers["content-type"] == "application/json"
+    with pytest.raises(TypeError):
+        headers["content-type"] = "text/plain"  # type: ignore[index]
+
+
+def test_decode_uses_declared_charset():
+    scraper = HTTPScraper()
+    raw = "Les Misérables".encode("latin-1")
+
+    text = scraper._decode_content(raw, {"content-type": 'text/html; Charset="ISO-8859-1"'})
+    fallback = scraper._decode_content("héllo".encode("utf-8"), {})
+
+    assert text == "Les Misérables"
+    assert fallback == "héllo"
+    declared = {"content-type": "text/html; charset=iso-8859-1"}
+    assert scraper._declared_charset(declared) == "iso-8859-1"
+    assert scraper._strip_tags("<p>un <b>deux</b></p>").split() == ["un", "deux"]
+
+
+def test_default_client_reuses_pooled_connection():
+    import httpx
+
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == "v1":
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            text="<html><body>Pooled</body></html>",
+            headers={"Content-Type": "text/html; charset=utf-8", "ETag": "v1"},
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with HTTPScraper(client=client, throttle_delay=0) as scraper:
+        first = scraper.fetch("https://example.com/page")
+        second = scraper.fetch("https://example.com/page")
+
+    assert first is not None and "Pooled" in first.content
+    assert second is not None and second.content == first.content
+    assert [request.url.path for request in seen] == ["/robots.txt", "/page", "/page"]
+    assert seen[1].headers["user-agent"] == scraper.user_agent
+    assert client.is_closed
+
+
+def test_content_hash_is_independent_of_source_encoding(monkeypatch):
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    utf8_url = "https://example.com/utf8"
+    latin_url = "https://example.com/latin"
+    responses[utf8_url].append(
+        FakeResponse("café crème", headers={"Content-Type": "text/plain; charset=utf-8"})
+    )
+    latin = FakeResponse("", headers={"Content-Type": "text/plain; charset=latin-1"})
+    latin._body = "café crème".encode("latin-1")
+    responses[latin_url].append(latin)
+
+    scraper = HTTPScraper(opener=build_urlopen(responses, records), throttle_delay=0)
+    monkeypatch.setattr(scraper, "_extract_content", lambda text: text)
+
+    first = scraper.fetch(utf8_url, respect_robots=False)
+    second = scraper.fetch(latin_url, respect_robots=False)
+
+    assert first is not None and second is not None
+    assert first.content == second.content == "café crème"
+    assert first.content_hash == second.content_hash
+    assert second.is_duplicate is True
+
+
+def test_strip_tags_drops_scripts_comments_and_entities(monkeypatch):
+    monkeypatch.setattr("app.scrapers.http.HTMLParser", None)
+    scraper = HTTPScraper()
+    html = (
+        "<html><head><style>p {color: red}</style></head><body>"
+        "<!-- menu --><p>Caf&eacute; &amp; cr&egrave;me</p>"
+        "<SCRIPT type='text/javascript'>var x = '<p>';</SCRIPT></body></html>"
+    )
+
+    assert scraper._strip_tags(html).split() == ["Café", "&", "crème"]
+
+
+def test_strip_tags_with_selectolax_drops_scripts():
+    pytest.importorskip("selectolax.lexbor")
+    from app.scrapers.http import strip_tags
+
+    html = (
+        "<html><head><style>p {color: red}</style></head><body>"
+        "<p>Caf&eacute; &amp; cr&egrave;me</p>"
+        "<script>var x=1;</script><noscript>JS requis</noscript></body></html>"
+    )
+
+    assert strip_tags(html).split() == ["Café", "&", "crème"]
+
+
+def test_extractor_cascade_uses_first_long_enough_result():
+    calls = []
+
+    def short(html):
+        calls.append("short")
+        return "tiny"
+
+    def full(html):
+        calls.append("full")
+        return "a much longer extraction"
+
+    def never(html):  # pragma: no cover - must be short-circuited
+        calls.append("never")
+        return "unused"
+
+    scraper = HTTPScraper(extractors=[short, full, never], min_chars=10)
+    assert scraper._extract_content("<p>page</p>") == "a much longer extraction"
+    assert calls == ["short", "full"]
+
+    empty = HTTPScraper(extractors=[lambda html: None])
+    assert empty._extract_content("<p>page</p>") == "<p>page</p>"
+
+
+def test_fast_mode_only_runs_trafilatura():
+    from app.scrapers.http import FAST_EXTRACTORS, extract_with_trafilatura
+
+    scraper = HTTPScraper(fast_mode=True)
+
+    assert scraper._extractors == FAST_EXTRACTORS == (extract_with_trafilatura,)
+
+
+def test_body_is_hashed_in_blocks_while_reading(monkeypatch):
+    from app.scrapers.http import _content_digest
+
+    monkeypatch.setattr("app.scrapers.http._READ_BLOCK", 4)
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    url = "https://example.com/plain"
+    responses[url].append(
+        FakeResponse("bonjour le monde", headers={"Content-Type": "text/plain"})
+    )
+    scraper = HTTPScraper(opener=build_urlopen(responses, records), throttle_delay=0)
+    monkeypatch.setattr(scraper, "_extract_content", lambda text: text)
+
+    digests = []
+    original = scraper._store_hash
+
+    def _spy(url, content, *, digest=None):
+        digests.append(digest)
+        return original(url, content, digest=digest)
+
+    monkeypatch.setattr(scraper, "_store_hash", _spy)
+    result = scraper.fetch(url, respect_robots=False)
+
+    assert result is not None and result.raw_content == b"bonjour le monde"
+    assert digests == [_content_digest(b"bonjour le monde")]
+    assert result.content_hash == digests[0]
+
+
+def test_non_html_payloads_skip_the_extractors():
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    json_url = "https://example.com/api"
+    text_url = "https://example.com/notes"
+    html_url = "https://example.com/page"
+    responses[json_url].append(
+        FakeResponse('{"a": "<b>"}', headers={"Content-Type": "application/json"})
+    )
+    responses[text_url].append(
+        FakeResponse("plain words", headers={"Content-Type": "text/html"})
+    )
+    responses[html_url].append(FakeResponse("<p>page</p>"))
+    calls = []
+
+    def extractor(html):
+        calls.append(html)
+        return "extracted"
+
+    scraper = HTTPScraper(
+        opener=build_urlopen(responses, records),
+        throttle_delay=0,
+        extractors=[extractor],
+    )
+
+    assert scraper.fetch(json_url, respect_robots=False).content == '{"a": "<b>"}'
+    assert scraper.fetch(text_url, respect_robots=False).content == "plain words"
+    assert scraper.fetch(html_url, respect_robots=False).content == "extracted"
+    assert calls == ["<p>page</p>"]
+
+
+def test_store_hash_moves_url_between_digests():
+    scraper = HTTPScraper()
+
+    first = scraper._store_hash("https://a.test/1", b"same")
+    scraper._store_hash("https://a.test/2", b"same")
+    scraper._store_hash("https://a.test/2", b"same")
+    assert scraper._hash_urls[first] == ["https://a.test/1", "https://a.test/2"]
+    assert scraper._hash_is_duplicate(first) is True
+
+    changed = scraper._store_hash("https://a.test/2", b"different")
+    assert scraper._hash_urls[first] == ["https://a.test/1"]
+    assert scraper._hash_is_duplicate(first) is False
+    scraper._store_hash("https://a.test/2", b"same")
+    assert changed not in scraper._hash_urls
+
+
+def test_detect_license_prefers_header_then_pattern_order():
+    from app.scrapers.http import detect_license
+
+    text = "Released under the GPL. See the Apache License and the MIT LICENSE."
+
+    assert detect_license({"x-license": " CC0 "}, text) == "CC0"
+    assert detect_license({}, text) == "MIT License"
+    assert detect_license({}, "Licensed under GPLv3") == "GNU General Public License"
+    assert detect_license({}, "no licence here") is None
+
+
+def test_fetch_many_uses_async_client_and_keeps_order():
+    import asyncio
+
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private")
+        if request.url.path == "/gone":
+            return httpx.Response(404)
+        return httpx.Response(
+            200,
+            text=f"<p>{request.url.host}{request.url.path}</p>",
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+
+    transport = httpx.MockTransport(handler)
+    scraper = HTTPScraper(
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+        throttle_delay=0,
+        extractors=[lambda html: html.replace("<p>", "").replace("</p>", "")],
+    )
+    urls = [
+        "https://b.test/two",
+        "https://a.test/one",
+        "https://a.test/private/x",
+        "https://a.test/gone",
+    ]
+
+    async def _run():
+        try:
+            return await scraper.fetch_many(urls, max_parallel=2)
+        finally:
+            await scraper.aclose()
+
+    results = asyncio.run(_run())
+    scraper.close()
+
+    assert [r.content if r else None for r in results] == [
+        "b.test/two",
+        "a.test/one",
+        None,
+        None,
+    ]
+
+
+def test_afetch_runs_custom_opener_in_a_thread():
+    import asyncio
+
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    url = "https://example.com/plain"
+    responses[url].append(FakeResponse("hello", headers={"Content-Type": "text/plain"}))
+    scraper = HTTPScraper(opener=build_urlopen(responses, records), throttle_delay=0)
+
+    result = asyncio.run(scraper.afetch(url, respect_robots=False))
+
+    assert result is not None and result.content == "hello"
+    assert records[0]["url"] == url
+
+
+def test_afetch_honours_injected_client():
+    import asyncio
+
+    import httpx
+
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, text="ok", headers={"Content-Type": "text/plain"})
+
+    scraper = HTTPScraper(
+        client=httpx.Client(transport=httpx.MockTransport(handler)), throttle_delay=0
+    )
+
+    result = asyncio.run(scraper.afetch("https://custom.test/a", respect_robots=False))
+    scraper.close()
+
+    assert result is not None and result.content == "ok"
+    assert seen == ["https://custom.test/a"]
+    assert scraper._async_client is None
+
+
+def test_aclose_releases_both_default_clients():
+    import asyncio
+
+    pytest.importorskip("httpx")
+    scraper = HTTPScraper()
+    sync_client, async_client = scraper._client, scraper._async_http()
+
+    async def _run():
+        async with scraper:
+            pass
+
+    asyncio.run(_run())
+
+    assert sync_client.is_closed and async_client.is_closed
+    assert scraper._async_client is None
+
+
+def test_fetch_many_thread_fallback_keeps_hash_index_consistent():
+    import asyncio
+
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    urls = [f"https://host{index}.test/page" for index in range(16)]
+    for url in urls:
+        responses[url].append(
+            FakeResponse("same body", headers={"Content-Type": "text/plain"})
+        )
+    scraper = HTTPScraper(opener=build_urlopen(responses, records), throttle_delay=0)
+
+    results = asyncio.run(
+        scraper.fetch_many(urls, respect_robots=False, max_parallel=8)
+    )
+
+    assert all(result is not None for result in results)
+    # Only the first page to be indexed is not flagged as a duplicate.
+    assert sum(not result.is_duplicate for result in results) == 1
+    assert [sorted(group) for group in scraper._hash_urls.values()] == [sorted(urls)]
+
+
+def test_send_raises_http_error_with_response_headers():
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, headers={"X-Reason": "absent"})
+
+    scraper = HTTPScraper(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    with pytest.raises(HTTPError) as excinfo:
+        scraper._send("https://missing.test/a", {})
+    scraper.close()
+
+    assert excinfo.value.code == 404
+    assert excinfo.value.headers["x-reason"] == "absent"
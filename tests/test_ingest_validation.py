@@ -151,3 +151,13 @@ def test_pipeline_handles_mixed_timezone_metadata_when_selecting_source() -> Non
     assert texts == ["Shared corroborated content"]
     assert metas[0]["source"] == "https://example.com/a"
     assert metas[0]["freshness_at"] == "2024-01-01T09:00:00+00:00"
+
+
+def test_normalise_and_chunk_collapse_whitespace() -> None:
+    from app.ingest.pipeline import _chunk_text, _normalise_text
+
+    text = _normalise_text("  un\tdeux\n\ntrois\u00a0 quatre  ")
+
+    assert text == "un deux trois quatre"
+    assert _normalise_text(" \n\t ") == ""
+    assert _chunk_text(text, 3, 1) == ["un deux trois", "trois quatre"]
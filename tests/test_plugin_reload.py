@@ -39,3 +39,132 @@ def test_reload_plugins():
             assert plugin.run() == "dummy plugin loaded"
         finally:
             cfg_path.write_text(original, encoding="utf-8")
+
+
+def test_module_signature_cached_until_source_changes(tmp_path, monkeypatch):
+    import hashlib
+    import os
+    import sys
+
+    module_path = tmp_path / "sig_cache_plugin.py"
+    module_path.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plugins.clear_signature_cache()
+
+    reads: list[object] = []
+    original = hashlib.file_digest
+
+    def _counting_file_digest(fileobj, digest):
+        reads.append(fileobj)
+        return original(fileobj, digest)
+
+    monkeypatch.setattr(hashlib, "file_digest", _counting_file_digest)
+
+    first = plugins.compute_module_signature("sig_cache_plugin")
+    assert plugins.compute_module_signature("sig_cache_plugin") == first
+    assert len(reads) == 1
+
+    module_path.write_text("VALUE = 22\n", encoding="utf-8")
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert plugins.compute_module_signature("sig_cache_plugin") != first
+    assert len(reads) == 2
+    expected = hashlib.sha256(module_path.read_bytes()).hexdigest()
+    assert plugins.compute_module_signature("sig_cache_plugin") == expected
+    sys.modules.pop("sig_cache_plugin", None)
+
+
+def test_module_signature_rehashes_when_mtime_is_restored(tmp_path, monkeypatch):
+    import hashlib
+    import os
+    import sys
+
+    module_path = tmp_path / "sig_restore_plugin.py"
+    module_path.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plugins.clear_signature_cache()
+    first = plugins.compute_module_signature("sig_restore_plugin")
+
+    stat = module_path.stat()
+    module_path.write_text("VALUE = 2\n", encoding="utf-8")
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    expected = hashlib.sha256(module_path.read_bytes()).hexdigest()
+    assert plugins.compute_module_signature("sig_restore_plugin") == expected
+    assert expected != first
+    sys.modules.pop("sig_restore_plugin", None)
+
+
+def test_reload_plugins_hashes_each_module_once(tmp_path, monkeypatch):
+    signature = plugins.compute_module_signature("tests.dummy_plugin")
+    manifest = tmp_path / "plugins.toml"
+    entry = (
+        "[[plugins]]\n"
+        'path = "tests.dummy_plugin:DummyPlugin"\n'
+        'api_version = "1.0"\n'
+        f'signature = "{signature}"\n'
+    )
+    manifest.write_text(
+        entry + entry + '[[plugins]]\npath = "missing.module:X"\n'
+        'api_version = "1.0"\nsignature = "00"\n',
+        encoding="utf-8",
+    )
+    calls: list[str] = []
+    original = plugins._module_digest
+
+    def _counting(module_name: str):
+        calls.append(module_name)
+        return original(module_name)
+
+    monkeypatch.setattr(plugins, "_module_digest", _counting)
+    monkeypatch.setattr(plugins, "discover_entry_point_plugins", lambda: [])
+
+    loaded = plugins.reload_plugins(manifest)
+
+    assert [plugin.module for plugin in loaded] == ["tests.dummy_plugin"] * 2
+    assert calls == ["tests.dummy_plugin", "missing.module"]
+
+
+def test_signature_matches_compares_raw_digests():
+    digest = bytes(range(32))
+
+    assert plugins._signature_matches(digest.hex(), digest)
+    assert plugins._signature_matches(digest.hex().upper(), digest)
+    assert not plugins._signature_matches("00" * 32, digest)
+    assert not plugins._signature_matches("not-hex", digest)
+
+
+def test_merkle_root_is_order_independent():
+    import hashlib
+
+    leaves = [hashlib.sha256(bytes([index])).digest() for index in range(3)]
+    ordered = sorted(leaves)
+
+    assert plugins._merkle_root(leaves) == plugins._merkle_root(leaves[::-1])
+    assert (
+        plugins._merkle_root(ordered)
+        == hashlib.sha256(
+            hashlib.sha256(ordered[0] + ordered[1]).digest() + ordered[2]
+        ).digest()
+    )
+    assert plugins._merkle_root(leaves[:1]) == leaves[0]
+
+
+def test_manifest_signature_replaces_per_plugin_checks(tmp_path, monkeypatch):
+    root = plugins.compute_manifest_signature(["tests.dummy_plugin"])
+    manifest = tmp_path / "plugins.toml"
+    entry = (
+        '[[plugins]]\npath = "tests.dummy_plugin:DummyPlugin"\napi_version = "1.0"\n'
+    )
+    monkeypatch.setattr(plugins, "discover_entry_point_plugins", lambda: [])
+
+    manifest.write_text(f'manifest_signature = "{root}"\n' + entry, encoding="utf-8")
+    loaded = plugins.reload_plugins(manifest)
+    assert [plugin.module for plugin in loaded] == ["tests.dummy_plugin"]
+    assert loaded[0].signature == plugins.compute_module_signature("tests.dummy_plugin")
+
+    manifest.write_text(
+        f'manifest_signature = "{"00" * 32}"\n' + entry + 'signature = "00"\n',
+        encoding="utf-8",
+    )
+    assert plugins.reload_plugins(manifest) == []
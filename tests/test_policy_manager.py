@@ -94,3 +94,185 @@ def test_policy_manager_detects_missing_entry_on_revoke(tmp_path: Path) -> None:
     manager = PolicyManager(home=home)
     with pytest.raises(PolicyError):
         manager.revoke("unknown.test")
+
+
+def test_policy_manager_reuses_cached_policy_until_file_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+
+    manager = PolicyManager(home=home)
+    manager.approve(domain="example.com", scope="web")
+
+    reads: list[Path] = []
+    original = Path.read_bytes
+
+    def _counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _counting_read_bytes)
+    manager.approve(domain="example.org", scope="web")
+    assert manager.policy_path not in reads
+    assert "example.org" in manager.show()
+
+    data = _load_policy(home)
+    data["allowlist_domains"].append("external.test")
+    manager.policy_path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+    assert "external.test" in manager._read_policy().allowlist_domains
+    assert manager.policy_path in reads
+
+
+def test_consent_ledger_entry_signature_matches_canonical_payload(
+    tmp_path: Path,
+) -> None:
+    import hashlib
+    import hmac
+    import json
+
+    from app.policy.ledger import ConsentLedger
+
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+    manager = PolicyManager(home=home)
+    ledger = ConsentLedger(manager.ledger_path)
+
+    ledger.record(action="approve", domain="exemple.fr", scope="web", policy_hash="abc")
+
+    entry = json.loads(manager.ledger_path.read_text(encoding="utf-8").splitlines()[-1])
+    signature = entry.pop("signature")
+    message = json.dumps(entry, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    secret = bytes.fromhex(str(ledger.metadata["secret_hex"]))
+    assert hmac.compare_digest(
+        signature, hmac.new(secret, message, hashlib.sha256).hexdigest()
+    )
+    assert entry["domain"] == "exemple.fr"
+
+
+def test_consent_ledger_keeps_one_append_handle(tmp_path: Path) -> None:
+    from app.policy.ledger import ConsentLedger
+
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+    path = PolicyManager(home=home).ledger_path
+    before = len(path.read_text(encoding="utf-8").splitlines())
+
+    with ConsentLedger(path) as ledger:
+        ledger.record(action="approve", domain="a.test", scope="web", policy_hash="h")
+        handle = ledger._fh
+        ledger.record(action="revoke", domain="a.test", scope="web", policy_hash="h")
+        assert ledger._fh is handle
+        assert len(path.read_text(encoding="utf-8").splitlines()) == before + 2
+
+    assert handle is not None and handle.closed
+
+
+def test_policy_manager_repeated_approve_skips_write_and_ledger(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+
+    manager = PolicyManager(home=home)
+    manager.approve(domain="example.com", scope="web")
+    policy_before = manager.policy_path.read_bytes()
+    ledger_before = manager.ledger_path.read_bytes()
+
+    again = manager.approve(domain="https://EXAMPLE.com/", scope="web")
+
+    assert again.created is False
+    assert manager.policy_path.read_bytes() == policy_before
+    assert manager.ledger_path.read_bytes() == ledger_before
+
+
+def test_policy_manager_approve_many_writes_once(tmp_path: Path, monkeypatch) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+    manager = PolicyManager(home=home)
+    manager.approve(domain="example.com", scope="web")
+    ledger_lines = len(manager.ledger_path.read_text(encoding="utf-8").splitlines())
+
+    writes: list[object] = []
+    original = manager._write_policy
+
+    def _counting_write(policy) -> None:
+        writes.append(policy)
+        original(policy)
+
+    monkeypatch.setattr(manager, "_write_policy", _counting_write)
+
+    approvals = manager.approve_many(
+        [
+            ("a.example", "web"),
+            ("example.com", "web"),
+            ("b.example", "git"),
+            ("a.example", "web"),
+        ]
+    )
+
+    assert [item.created for item in approvals] == [True, False, True, False]
+    assert len(writes) == 1
+    data = _load_policy(home)
+    assert {"domain": "a.example", "scope": "web"} in data["domain_rules"]
+    assert {"domain": "b.example", "scope": "git"} in data["domain_rules"]
+    lines = manager.ledger_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == ledger_lines + 2
+
+    with pytest.raises(PolicyError):
+        manager.approve_many([("c.example", "web"), ("d.example", "ftp")])
+    assert "c.example" not in _load_policy(home)["allowlist_domains"]
+
+
+def test_policy_manager_skips_validation_for_identical_rewrite(
+    tmp_path: Path, monkeypatch
+) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+    manager = PolicyManager(home=home)
+    first = manager._current_policy()
+
+    parses: list[bytes] = []
+    original = PolicyManager._parse
+
+    def _counting_parse(raw: bytes):
+        parses.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(PolicyManager, "_parse", staticmethod(_counting_parse))
+    # Simulate a touch: the stat key no longer matches but the bytes do.
+    manager._cache = (-1, -1) + manager._cache[2:]
+
+    assert manager._current_policy() is first
+    assert parses == []
+
+
+def test_policy_manager_context_closes_ledger(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+
+    with PolicyManager(home=home) as manager:
+        manager.approve(domain="example.com", scope="web")
+        ledger = manager._ledger
+        assert ledger is not None and ledger._fh is not None
+
+    assert manager._ledger is None
+    assert ledger._fh is None
+
+
+def test_scheduler_loads_shared_policy_without_copying(tmp_path: Path) -> None:
+    from app.autopilot.scheduler import AutopilotScheduler
+
+    home = tmp_path / "home"
+    home.mkdir()
+    FirstRunConfigurator(home=home).run(auto=True, download_models=False)
+    manager = PolicyManager(home=home)
+    scheduler = AutopilotScheduler(policy_manager=manager)
+
+    assert scheduler._policy_loader() is scheduler._policy_loader()
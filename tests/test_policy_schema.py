@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from app.policy.schema import NetworkWindow
+
+
+def test_network_window_days_expand_dedupe_and_order() -> None:
+    window = NetworkWindow(
+        days=["Friday", "mon-wed", "tue", "sat-sun", " "], start="08:00", end="18:00"
+    )
+
+    assert window.days == ["mon", "tue", "wed", "fri", "sat", "sun"]
+    assert NetworkWindow(days="mon-sun", start="08:00", end="18:00").days == [
+        "mon",
+        "tue",
+        "wed",
+        "thu",
+        "fri",
+        "sat",
+        "sun",
+    ]
+
+
+@pytest.mark.parametrize("days", [["sun-mon"], ["funday"], ["mon-xyz"], [""]])
+def test_network_window_rejects_invalid_days(days: list[str]) -> None:
+    with pytest.raises(ValidationError):
+        NetworkWindow(days=days, start="08:00", end="18:00")
+
+
+def test_policy_to_dict_keeps_policy_yaml_layout() -> None:
+    from app.policy.schema import Policy
+
+    entry = {"name": "m.gguf", "sha256": "0" * 64, "license": "MIT"}
+    policy = Policy.model_validate(
+        {
+            "network_windows": [{"days": ["mon"], "start": "02:00", "end": "04:30"}],
+            "budgets": {"bandwidth_mb_per_day": 1, "cpu_percent_cap": 2, "ram_mb_cap": 3},
+            "allowlist_domains": ["Example.com"],
+            "subject": {"hostname": "h", "generated_at": "2024-01-01T00:00:00+00:00"},
+            "models": {"llm": entry, "embedding": entry},
+        }
+    )
+
+    data = policy.to_dict()
+
+    assert list(data)[-3:] == ["domain_rules", "models", "subject"]
+    assert data["network_windows"] == [{"days": ["mon"], "start": "02:00", "end": "04:30"}]
+    assert data["domain_rules"] == [{"domain": "example.com", "scope": "web"}]
+    assert data["subject"]["generated_at"] == "2024-01-01T00:00:00+00:00"
+    policy.subject = None
+    assert "subject" not in policy.to_dict()
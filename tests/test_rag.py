@@ -0,0 +1,55 @@
+from app.llm import rag
+
+
+def test_answer_question_reuses_default_client_and_store(monkeypatch) -> None:
+    created: list[str] = []
+
+    class FakeStore:
+        def __init__(self) -> None:
+            created.append("store")
+
+        def search(self, question: str, k: int = 3):
+            return [({"text": "Paris est la capitale."}, 0.9)]
+
+    class FakeClient:
+        def __init__(self) -> None:
+            created.append("client")
+
+        def generate(self, prompt: str, *, separator: str = ""):
+            return f"len={len(prompt)}", "success"
+
+    monkeypatch.setattr(rag, "SimpleVectorStore", FakeStore)
+    monkeypatch.setattr(rag, "Client", FakeClient)
+    monkeypatch.setattr(rag, "_default_client", None)
+    monkeypatch.setattr(rag, "_default_store", None)
+
+    first = rag.answer_question("Capitale ?")
+    second = rag.answer_question("Capitale ?")
+
+    assert first == second
+    assert created == ["store", "client"]
+
+
+def test_build_prompt_numbers_passages_by_position() -> None:
+    prompt = rag.build_prompt("Pourquoi ?", ["alpha", "", "gamma"])
+
+    assert prompt.startswith("Contexte:\nPASSAGE 1:\nalpha\n\nPASSAGE 3:\ngamma\n\n")
+    assert "Question: Pourquoi ?\n" in prompt
+    assert rag.build_prompt("Q", []).startswith("Contexte: (aucun)\n\nQuestion: Q\n")
+
+
+def test_answer_question_drops_passages_past_prompt_limit() -> None:
+    class FakeStore:
+        def search(self, question: str, k: int = 3):
+            return [({"text": "a" * 50}, 0.9), ({"text": "b" * 50}, 0.8)]
+
+    class FakeClient:
+        max_prompt_chars = len(rag.build_prompt("Q ?", ["a" * 50]))
+
+        def generate(self, prompt: str, *, separator: str = ""):
+            return prompt, "success"
+
+    answer = rag.answer_question("Q ?", client=FakeClient(), store=FakeStore())
+
+    assert "a" * 50 in answer
+    assert "b" * 50 not in answer
@@ -15,8 +15,12 @@ class FakeResponse:
             for key, value in headers.items():
                 self.headers[key] = value
 
-    def read(self) -> bytes:
-        return self._body
+    def read(self, amt: int = -1) -> bytes:
+        # Behave like a real response: the body is consumed by reading it.
+        if amt < 0:
+            amt = len(self._body)
+        chunk, self._body = self._body[:amt], self._body[amt:]
+        return chunk
 
     def __enter__(self) -> "FakeResponse":  # pragma: no cover
         return self
@@ -121,3 +125,52 @@ def test_throttling_waits_between_requests():
     assert records[0]["url"] == robots_url
     assert records[1]["url"] == page_url
     assert records[2]["url"] == page_url
+
+
+def test_robots_rules_expire_after_ttl():
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    robots_url = "https://example.com/robots.txt"
+    responses[robots_url].append(FakeResponse("User-agent: *\nAllow: /"))
+    responses[robots_url].append(FakeResponse("User-agent: *\nDisallow: /"))
+    page_url = "https://example.com/page"
+    for _ in range(2):
+        responses[page_url].append(FakeResponse("ok"))
+
+    clock = FakeClock()
+    scraper = HTTPScraper(
+        opener=build_urlopen(responses, records),
+        throttle_delay=0,
+        robots_ttl=60.0,
+        time_func=clock.time,
+        sleep_func=clock.sleep,
+    )
+
+    assert scraper.fetch_raw(page_url) is not None
+    clock.advance(30.0)
+    assert scraper.fetch_raw(page_url) is not None
+    clock.advance(31.0)
+    assert scraper.fetch_raw(page_url) is None
+
+    assert [record["url"] for record in records].count(robots_url) == 2
+
+
+def test_prefetch_robots_fetches_each_host_once():
+    responses: Dict[str, List[object]] = defaultdict(list)
+    records: List[Dict[str, object]] = []
+    for host in ("a.test", "b.test"):
+        responses[f"https://{host}/robots.txt"].append(
+            FakeResponse("User-agent: *\nDisallow: /private")
+        )
+
+    scraper = HTTPScraper(opener=build_urlopen(responses, records))
+    scraper.prefetch_robots(
+        ["https://a.test/x", "https://b.test/y", "https://a.test/z"]
+    )
+    scraper.prefetch_robots(["https://a.test/again"])
+
+    assert sorted(record["url"] for record in records) == [
+        "https://a.test/robots.txt",
+        "https://b.test/robots.txt",
+    ]
+    assert scraper._is_allowed("https://b.test/private/page") is False
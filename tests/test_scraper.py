@@ -1,16 +1,30 @@
 import asyncio
+import hashlib
 from pathlib import Path
 from types import SimpleNamespace
+from urllib.error import URLError
+
+import pytest
 
 from app.data import scraper
 
 
+@pytest.fixture(autouse=True)
+def _fresh_limiter(monkeypatch):
+    """Isolate tests from the process-wide rate limiter."""
+
+    monkeypatch.setattr(scraper, "_LIMITER", scraper.DomainRateLimiter())
+
+
 class DummyResponse:
     def __init__(self, text: str):
-        self._text = text
+        self._payload = text.encode("utf-8")
 
-    def read(self) -> bytes:  # pragma: no cover - simple accessor
-        return self._text.encode("utf-8")
+    def read(self, size: int = -1) -> bytes:  # pragma: no cover - simple accessor
+        if size < 0:
+            size = len(self._payload)
+        chunk, self._payload = self._payload[:size], self._payload[size:]
+        return chunk
 
     def __enter__(self) -> "DummyResponse":  # pragma: no cover - context mgr
         return self
@@ -79,3 +93,158 @@ def test_scrape_uses_default_cache(monkeypatch, tmp_path):
     stored_path = Path(results[url])
     assert stored_path.parent == default_cache
     assert stored_path.read_text() == "payload"
+
+
+def test_rate_limiter_reuses_domain_lock(monkeypatch):
+    """The limiter keeps a single lock per domain and spaces out requests."""
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(scraper.asyncio, "sleep", fake_sleep)
+    limiter = scraper.DomainRateLimiter(delay=10.0)
+
+    async def _run() -> None:
+        await limiter.wait("example.com")
+        first = limiter._locks["example.com"]
+        await limiter.wait("example.com")
+        assert limiter._locks["example.com"] is first
+
+    asyncio.run(_run())
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 10.0
+
+
+def test_scrape_all_deduplicates_equivalent_urls(monkeypatch, tmp_path):
+    """Equivalent spellings of a URL trigger a single download."""
+
+    fetched: list[str] = []
+
+    def fake_urlopen(url: str):
+        fetched.append(url)
+        return DummyResponse("payload")
+
+    monkeypatch.setattr(
+        scraper, "urllib_request", SimpleNamespace(urlopen=fake_urlopen)
+    )
+    urls = [
+        "https://Example.com",
+        "https://example.com:443/#top",
+        "https://example.com/?b=2&a=1",
+        "https://example.com/?a=1&b=2",
+    ]
+
+    results = asyncio.run(scraper.scrape_all(urls, tmp_path))
+
+    assert fetched == ["https://Example.com", "https://example.com/?b=2&a=1"]
+    assert set(results) == set(urls)
+    assert results[urls[0]] == results[urls[1]]
+    assert results[urls[2]] == results[urls[3]]
+
+
+def test_normalise_url_keeps_ipv6_brackets():
+    assert scraper._normalise_url("http://[::1]:8080/a") == "http://[::1]:8080/a"
+    assert scraper._normalise_url("http://[::1]:80") == "http://[::1]/"
+
+
+def test_scrape_all_survives_malformed_port(monkeypatch, tmp_path):
+    """A URL with an invalid port is skipped without aborting the batch."""
+
+    def fake_urlopen(url: str):
+        if url != "http://good.test/":
+            raise URLError("bad port")
+        return DummyResponse("payload")
+
+    monkeypatch.setattr(
+        scraper, "urllib_request", SimpleNamespace(urlopen=fake_urlopen)
+    )
+
+    results = asyncio.run(
+        scraper.scrape_all(
+            ["http://x:abc/", "http://x:99999/", "http://good.test/"], tmp_path
+        )
+    )
+
+    assert list(results) == ["http://good.test/"]
+
+
+def test_fetch_sync_returns_size_and_digest(monkeypatch, tmp_path):
+    """Downloads are streamed to disk and hashed on the way."""
+
+    monkeypatch.setattr(
+        scraper,
+        "urllib_request",
+        SimpleNamespace(urlopen=lambda url: DummyResponse("payload")),
+    )
+    target = tmp_path / "page.html"
+
+    size, digest = scraper._fetch_sync("https://example.com/page", target)
+
+    assert size == len("payload")
+    assert digest == hashlib.sha256(b"payload").hexdigest()
+    assert target.read_bytes() == b"payload"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_iter_scrape_streams_results(monkeypatch, tmp_path):
+    """iter_scrape yields one pair per input URL and skips failures."""
+
+    def fake_urlopen(url: str):
+        if url.endswith("/broken"):
+            raise URLError("boom")
+        return DummyResponse(url)
+
+    monkeypatch.setattr(
+        scraper, "urllib_request", SimpleNamespace(urlopen=fake_urlopen)
+    )
+    urls = ["https://a.example/", "https://b.example/", "https://c.example/broken"]
+
+    async def _collect() -> list[tuple[str, str]]:
+        return [
+            pair async for pair in scraper.iter_scrape(urls, tmp_path, concurrency=2)
+        ]
+
+    pairs = asyncio.run(_collect())
+
+    assert sorted(url for url, _ in pairs) == urls[:2]
+    for url, path in pairs:
+        assert Path(path).read_text() == url
+
+
+def test_failed_stream_leaves_no_partial_file(monkeypatch, tmp_path):
+    """An interrupted download does not leave a cache entry behind."""
+
+    class BrokenResponse(DummyResponse):
+        def read(self, size: int = -1) -> bytes:
+            raise URLError("connection reset")
+
+    monkeypatch.setattr(
+        scraper,
+        "urllib_request",
+        SimpleNamespace(urlopen=lambda url: BrokenResponse("")),
+    )
+
+    results = asyncio.run(scraper.scrape_all(["https://example.com/"], tmp_path))
+
+    assert results == {}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_limiter_survives_new_event_loops(monkeypatch):
+    """The module limiter keeps timestamps across separate asyncio.run calls."""
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(scraper.asyncio, "sleep", fake_sleep)
+    limiter = scraper.DomainRateLimiter(delay=10.0)
+
+    asyncio.run(limiter.wait("example.org"))
+    asyncio.run(limiter.wait("example.org"))
+
+    assert len(sleeps) == 1
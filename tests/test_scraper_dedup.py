@@ -0,0 +1,86 @@
+import pytest
+
+from app.scrapers import dedup
+from app.scrapers.dedup import ContentDedupTracker, shingles
+
+
+def test_shingles_tokenise_lowercase_words():
+    grams = list(shingles("Hello, World! 2024 edition of the news", size=3))
+
+    assert grams[0] == b"hello world 2024"
+    assert grams[-1] == b"of the news"
+    assert list(shingles("Deux mots", size=5)) == [b"deux mots"]
+    assert list(shingles("  ...  ")) == []
+
+
+def test_shingles_keep_accented_and_non_latin_words():
+    grams = list(shingles("Ma couleur PRÉFÉRÉE", size=3))
+
+    assert grams == ["ma couleur préférée".encode("utf-8")]
+    assert list(shingles("Привет мир", size=5)) == ["привет мир".encode("utf-8")]
+
+
+def test_tracker_is_inert_without_datasketch(monkeypatch):
+    monkeypatch.setattr(dedup, "MinHashLSH", None)
+    tracker = ContentDedupTracker()
+
+    assert tracker.enabled is False
+    assert tracker.check("a", "same text") is False
+    assert tracker.check("b", "same text") is False
+
+
+class _ExactMinHash:
+    def __init__(self, num_perm: int) -> None:
+        self.grams: frozenset[bytes] = frozenset()
+
+    def update_batch(self, grams) -> None:
+        self.grams = frozenset(grams)
+
+
+class _ExactLSH:
+    """Stand-in index matching identical shingle sets only."""
+
+    def __init__(self, threshold: float, num_perm: int) -> None:
+        self.entries: dict[str, frozenset[bytes]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def insert(self, key: str, signature: _ExactMinHash) -> None:
+        self.entries[key] = signature.grams
+
+    def remove(self, key: str) -> None:
+        del self.entries[key]
+
+    def query(self, signature: _ExactMinHash) -> list[str]:
+        return [key for key, grams in self.entries.items() if grams == signature.grams]
+
+
+def test_tracker_evicts_least_recently_checked(monkeypatch):
+    monkeypatch.setattr(dedup, "MinHash", _ExactMinHash)
+    monkeypatch.setattr(dedup, "MinHashLSH", _ExactLSH)
+    tracker = ContentDedupTracker(capacity=2)
+
+    assert tracker.check("a", "premier texte") is False
+    assert tracker.check("b", "premier texte") is True
+    assert tracker.check("c", "second texte") is False
+
+    assert sorted(tracker._lsh.entries) == ["b", "c"]
+    assert tracker.is_duplicate("b")
+    # "a" was evicted, so the same text is new again for another key.
+    assert tracker.check("a", "troisième texte") is False
+    assert sorted(tracker._lsh.entries) == ["a", "c"]
+    assert not tracker.is_duplicate("b")
+
+
+def test_tracker_flags_near_duplicates():
+    pytest.importorskip("datasketch")
+    body = " ".join(f"word{index}" for index in range(200))
+    tracker = ContentDedupTracker()
+
+    assert tracker.check("https://a.test/1", f"Published 09:00 {body}") is False
+    assert tracker.check("https://b.test/1", f"Published 10:30 {body}") is True
+    assert tracker.check("https://c.test/1", "an unrelated article entirely") is False
+    assert tracker.is_duplicate("https://b.test/1")
+    # Re-checking a URL does not match against its own previous signature.
+    assert tracker.check("https://c.test/1", "an unrelated article entirely") is False
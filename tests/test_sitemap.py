@@ -0,0 +1,54 @@
+import threading
+from typing import Dict, Mapping
+
+from app.scrapers.sitemap import SitemapScraper
+
+
+class StubHTTP:
+    def __init__(self, documents: Dict[str, bytes]) -> None:
+        self.documents = documents
+        self.threads: set[str] = set()
+
+    def fetch_raw(
+        self, url: str, *, respect_robots: bool = True
+    ) -> tuple[bytes, Mapping[str, str]] | None:
+        self.threads.add(threading.current_thread().name)
+        body = self.documents.get(url)
+        return None if body is None else (body, {})
+
+
+def _urlset(*urls: str) -> bytes:
+    locs = "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+    return (
+        "<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>"
+        f"{locs}</urlset>"
+    ).encode()
+
+
+def test_sitemap_index_children_are_fetched_and_flattened() -> None:
+    index = (
+        b"<sitemapindex xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>"
+        b"<sitemap><loc>https://a.test/one.xml</loc></sitemap>"
+        b"<sitemap><loc>https://a.test/missing.xml</loc></sitemap>"
+        b"<sitemap><loc>https://a.test/two.xml</loc></sitemap>"
+        b"</sitemapindex>"
+    )
+    http = StubHTTP(
+        {
+            "https://a.test/sitemap.xml": index,
+            "https://a.test/one.xml": _urlset("https://a.test/1", "https://a.test/2"),
+            "https://a.test/two.xml": _urlset("https://a.test/3"),
+        }
+    )
+
+    urls = SitemapScraper(http).fetch("https://a.test/sitemap.xml")
+
+    assert urls == ["https://a.test/1", "https://a.test/2", "https://a.test/3"]
+    assert any(name.startswith("sitemap") for name in http.threads)
+
+
+def test_parse_ignores_invalid_xml_and_blank_locations() -> None:
+    assert SitemapScraper.parse(b"<urlset><url><loc>") == []
+    assert SitemapScraper.parse(_urlset(" https://a.test/x ", " ")) == [
+        "https://a.test/x"
+    ]